@@ -23,7 +23,7 @@ engine._discover_conversation_signals(target_posts=20)
 # Collect conversation details with authors
 conversation_details = []
 for company_name, data in engine.companies.items():
-    for post in data['conversations']:
+    for post in data.conversations:
         conversation_details.append({
             'publisher': company_name,
             'title': post.get('title', ''),
@@ -7,26 +7,57 @@ Runs every Monday at 8 AM UTC via GitHub Actions
 
 import os
 import sys
+from collections import Counter
 from datetime import datetime
 import pandas as pd
 
+try:
+    import pyarrow  # Optional - parquet engine for the dashboard's fast-load copies
+except ImportError:
+    pyarrow = None
+
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scrapers.company_discovery_v3 import CompanyDiscoveryV3
 
 
+def save_frame(df: pd.DataFrame, csv_file: str):
+    """
+    Save a weekly output as CSV, plus a same-named .parquet copy when pyarrow
+    is installed (the dashboard reads the parquet copy when present)
+
+    Args:
+        df: Frame to save
+        csv_file: Destination .csv path
+    """
+    df.to_csv(csv_file, index=False)
+
+    if pyarrow is not None:
+        try:
+            df.to_parquet(os.path.splitext(csv_file)[0] + ".parquet", index=False)
+        except Exception as e:
+            print(f"   ⚠️  Parquet copy skipped: {str(e)[:100]}")
+
+
 def main():
     """Run weekly data refresh"""
 
+    # One clock reading names the week folder and the files, so a run that
+    # crosses midnight (or a week boundary) still writes a consistent set
+    run_started = datetime.now()
+    week_id = run_started.strftime('%Y_W%U')
+    timestamp = run_started.strftime('%Y%m%d_%H%M%S')
+
     print("=" * 70)
-    print(f"🚀 WEEKLY REFRESH - Week {datetime.now().strftime('%Y_W%U')}")
+    print(f"🚀 WEEKLY REFRESH - Week {week_id}")
     print("=" * 70)
     print("Company-Centric GTM Intelligence for SaaS Security")
     print("=" * 70)
 
-    # Initialize V3 discovery engine
-    engine = CompanyDiscoveryV3()
+    # Initialize V3 discovery engine (checkpointed, so a crashed run can be
+    # re-run the same week without repeating finished work)
+    engine = CompanyDiscoveryV3(checkpoint_path="data/discovery_checkpoint.jsonl", run_id=week_id)
 
     # Run all data sources (with error handling to ensure pipeline completes)
     print("\n1️⃣ Running Indeed scraping...")
@@ -71,21 +102,19 @@ def main():
     tracker = engine._generate_company_tracker()
 
     # Create output directory
-    week_id = datetime.now().strftime('%Y_W%U')
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     week_dir = f"data/weekly/{week_id}"
     os.makedirs(week_dir, exist_ok=True)
 
     # Save company tracker
     tracker_df = pd.DataFrame(tracker)
     tracker_file = f"{week_dir}/company_tracker_{timestamp}.csv"
-    tracker_df.to_csv(tracker_file, index=False)
+    save_frame(tracker_df, tracker_file)
     print(f"   💾 Saved: {tracker_file}")
 
     # Save hiring details
     hiring_details = []
     for company_name, data in engine.companies.items():
-        for job in data['hiring']:
+        for job in data.hiring:
             hiring_details.append({
                 'company_name': company_name,
                 'title': job.get('title', ''),
@@ -98,13 +127,13 @@ def main():
     if hiring_details:
         hiring_df = pd.DataFrame(hiring_details)
         hiring_file = f"{week_dir}/hiring_details_{timestamp}.csv"
-        hiring_df.to_csv(hiring_file, index=False)
+        save_frame(hiring_df, hiring_file)
         print(f"   💾 Saved: {hiring_file}")
 
     # Save conversation details
     conversation_details = []
     for company_name, data in engine.companies.items():
-        for post in data['conversations']:
+        for post in data.conversations:
             conversation_details.append({
                 'publisher': company_name,
                 'title': post.get('title', ''),
@@ -117,14 +146,19 @@ def main():
     if conversation_details:
         conv_df = pd.DataFrame(conversation_details)
         conv_file = f"{week_dir}/conversation_details_{timestamp}.csv"
-        conv_df.to_csv(conv_file, index=False)
+        save_frame(conv_df, conv_file)
         print(f"   💾 Saved: {conv_file}")
 
+    # Results are on disk - drop the crash-recovery checkpoint
+    engine.clear_checkpoint()
+
+    activity_counts = Counter(c['activity_type'] for c in tracker)
+
     print(f"\n✅ Weekly refresh complete!")
     print(f"   Total companies: {len(tracker)}")
-    print(f"   High priority (both signals): {len([c for c in tracker if c['activity_type'] == 'both'])}")
-    print(f"   Hiring only: {len([c for c in tracker if c['activity_type'] == 'hiring_only'])}")
-    print(f"   Talking only: {len([c for c in tracker if c['activity_type'] == 'talking_only'])}")
+    print(f"   High priority (both signals): {activity_counts['both']}")
+    print(f"   Hiring only: {activity_counts['hiring_only']}")
+    print(f"   Talking only: {activity_counts['talking_only']}")
 
 
 if __name__ == "__main__":
@@ -11,21 +11,21 @@ This is the "intelligence layer" that filters signal from noise.
 
 import os
 import json
-from typing import Dict, List, Optional
-from openai import OpenAI
+from typing import Dict, Optional
 from dotenv import load_dotenv
 import sys
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.keywords import HIRING_KEYWORDS, MIN_RELEVANCE_SCORE
+from config.keywords import HIRING_KEYWORDS
+from processors.classifier_common import JobBatchingMixin, openai_client
 
 # Load environment variables
 load_dotenv()
 
 
-class JobClassifier:
+class JobClassifier(JobBatchingMixin):
     """Classify job postings using GPT-4 Mini"""
 
     def __init__(self, api_key: Optional[str] = None, use_mock: bool = False):
@@ -37,6 +37,7 @@ class JobClassifier:
             use_mock: If True, use mock responses (for testing without API key)
         """
         self.use_mock = use_mock
+        self._init_batching()
 
         if not use_mock:
             self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -46,7 +47,7 @@ class JobClassifier:
                 self.use_mock = True
             else:
                 try:
-                    self.client = OpenAI(api_key=self.api_key)
+                    self.client = openai_client(self.api_key)
                     print("✅ OpenAI client initialized (GPT-4 Mini)")
                 except Exception as e:
                     print(f"⚠️  Failed to initialize OpenAI: {e}")
@@ -171,76 +172,6 @@ Scoring guide:
 
         return job_data
 
-    def batch_classify(self, jobs: List[Dict], batch_size: int = 10) -> List[Dict]:
-        """
-        Classify multiple jobs
-
-        Args:
-            jobs: List of job dictionaries
-            batch_size: Number of jobs to process before showing progress
-
-        Returns:
-            List of classified jobs
-        """
-        print(f"\n🤖 Classifying {len(jobs)} jobs with {'GPT-4 Mini' if not self.use_mock else 'mock classifier'}...")
-
-        classified_jobs = []
-        for i, job in enumerate(jobs):
-            try:
-                classified_job = self.classify_job(job)
-                classified_jobs.append(classified_job)
-
-                if (i + 1) % batch_size == 0:
-                    print(f"   Processed {i + 1}/{len(jobs)} jobs...")
-
-            except Exception as e:
-                print(f"⚠️  Error classifying job {i}: {e}")
-                job["relevance_score"] = 0.5  # Default score
-                classified_jobs.append(job)
-
-        print(f"✅ Classification complete!\n")
-        return classified_jobs
-
-    def filter_by_relevance(self, jobs: List[Dict], min_score: Optional[float] = None) -> List[Dict]:
-        """
-        Filter jobs by relevance score
-
-        Args:
-            jobs: List of classified jobs
-            min_score: Minimum relevance score (default from config)
-
-        Returns:
-            Filtered list of jobs
-        """
-        min_score = min_score or MIN_RELEVANCE_SCORE
-        filtered = [j for j in jobs if j.get("relevance_score", 0) >= min_score]
-
-        print(f"🔍 Filtered: {len(filtered)}/{len(jobs)} jobs above {min_score} relevance score")
-        return filtered
-
-    def get_classification_stats(self, jobs: List[Dict]) -> Dict:
-        """Get statistics about classified jobs"""
-        if not jobs:
-            return {}
-
-        relevance_scores = [j.get("relevance_score", 0) for j in jobs]
-
-        stats = {
-            "total_jobs": len(jobs),
-            "avg_relevance": sum(relevance_scores) / len(relevance_scores),
-            "high_relevance": sum(1 for score in relevance_scores if score >= 0.8),
-            "medium_relevance": sum(1 for score in relevance_scores if 0.6 <= score < 0.8),
-            "low_relevance": sum(1 for score in relevance_scores if score < 0.6),
-            "by_category": {},
-        }
-
-        # Count by category
-        for job in jobs:
-            category = job.get("job_category", "Unknown")
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
-
-        return stats
-
 
 def main():
     """Test classification with demo data"""
@@ -262,8 +193,8 @@ def main():
     # Classify jobs
     classified_jobs = classifier.batch_classify(jobs)
 
-    # Filter by relevance
-    relevant_jobs = classifier.filter_by_relevance(classified_jobs)
+    # Filter by relevance (stats come from the same pass)
+    relevant_jobs, stats = classifier.summarize_and_filter(classified_jobs)
 
     # Show results
     print("\n📊 CLASSIFICATION RESULTS:")
@@ -279,7 +210,6 @@ def main():
 
     # Show stats
     print("\n" + "=" * 70)
-    stats = classifier.get_classification_stats(classified_jobs)
     print("📈 CLASSIFICATION STATISTICS:")
     print(f"   Total jobs: {stats['total_jobs']}")
     print(f"   Average relevance: {stats['avg_relevance']:.2f}")
@@ -12,20 +12,21 @@ This is the "intelligence layer" that filters signal from noise.
 import os
 import json
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 from dotenv import load_dotenv
 import sys
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.keywords import HIRING_KEYWORDS, MIN_RELEVANCE_SCORE
+from config.keywords import HIRING_KEYWORDS
+from processors.classifier_common import JobBatchingMixin, openai_client
 
 # Load environment variables
 load_dotenv()
 
 
-class JobClassifier:
+class JobClassifier(JobBatchingMixin):
     """Classify job postings using OpenAI GPT-4o-mini"""
 
     def __init__(self, api_key: Optional[str] = None, use_mock: bool = False, provider: str = "openai"):
@@ -39,6 +40,7 @@ class JobClassifier:
         """
         self.use_mock = use_mock
         self.provider = None
+        self._init_batching()
         self.categories = list(HIRING_KEYWORDS.keys())
 
         if use_mock:
@@ -50,8 +52,7 @@ class JobClassifier:
             openai_key = api_key or os.getenv("OPENAI_API_KEY")
             if openai_key and not openai_key.startswith("sk-your"):
                 try:
-                    from openai import OpenAI
-                    self.client = OpenAI(api_key=openai_key)
+                    self.client = openai_client(openai_key)
                     self.provider = "openai"
                     print("✅ OpenAI GPT-4 Mini initialized")
                     return
@@ -73,7 +74,7 @@ class JobClassifier:
         Returns:
             Enhanced job_data with relevance_score and validated category
         """
-        if self.use_mock:
+        if self.use_mock or self._quota_exhausted.is_set():
             return self._mock_classify(job_data)
 
         # Build classification prompt
@@ -95,9 +96,12 @@ class JobClassifier:
             error_msg = str(e)
             # Check if it's a quota/rate limit error
             if "429" in error_msg or "quota" in error_msg.lower() or "RESOURCE_EXHAUSTED" in error_msg:
-                print(f"⚠️  API quota exhausted. Falling back to mock classification.")
-                # Switch to mock mode for remaining jobs
-                self.use_mock = True
+                # Switch to mock for remaining jobs. Worker threads may be
+                # mid-batch, so only the thread-safe flag is set here;
+                # batch_classify turns on use_mock once its pool is done
+                if not self._quota_exhausted.is_set():
+                    print(f"⚠️  API quota exhausted. Falling back to mock classification.")
+                self._quota_exhausted.set()
                 return self._mock_classify(job_data)
             else:
                 print(f"⚠️  Classification error: {e}")
@@ -186,57 +190,9 @@ Scoring guide:
 
         return job_data
 
-    def batch_classify(self, jobs: List[Dict], batch_size: int = 10) -> List[Dict]:
-        """Classify multiple jobs"""
-        provider_name = "Mock" if self.use_mock else ("Google Gemini" if self.provider == "gemini" else "GPT-4 Mini")
-        print(f"\n🤖 Classifying {len(jobs)} jobs with {provider_name}...")
-
-        classified_jobs = []
-        for i, job in enumerate(jobs):
-            try:
-                classified_job = self.classify_job(job)
-                classified_jobs.append(classified_job)
-
-                if (i + 1) % batch_size == 0:
-                    print(f"   Processed {i + 1}/{len(jobs)} jobs...")
-
-            except Exception as e:
-                print(f"⚠️  Error classifying job {i}: {e}")
-                job["relevance_score"] = 0.5
-                classified_jobs.append(job)
-
-        print(f"✅ Classification complete!\n")
-        return classified_jobs
-
-    def filter_by_relevance(self, jobs: List[Dict], min_score: Optional[float] = None) -> List[Dict]:
-        """Filter jobs by relevance score"""
-        min_score = min_score or MIN_RELEVANCE_SCORE
-        filtered = [j for j in jobs if j.get("relevance_score", 0) >= min_score]
-
-        print(f"🔍 Filtered: {len(filtered)}/{len(jobs)} jobs above {min_score} relevance score")
-        return filtered
-
-    def get_classification_stats(self, jobs: List[Dict]) -> Dict:
-        """Get statistics about classified jobs"""
-        if not jobs:
-            return {}
-
-        relevance_scores = [j.get("relevance_score", 0) for j in jobs]
-
-        stats = {
-            "total_jobs": len(jobs),
-            "avg_relevance": sum(relevance_scores) / len(relevance_scores),
-            "high_relevance": sum(1 for score in relevance_scores if score >= 0.8),
-            "medium_relevance": sum(1 for score in relevance_scores if 0.6 <= score < 0.8),
-            "low_relevance": sum(1 for score in relevance_scores if score < 0.6),
-            "by_category": {},
-        }
-
-        for job in jobs:
-            category = job.get("job_category", "Unknown")
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
-
-        return stats
+    def _provider_name(self) -> str:
+        """Label for progress output"""
+        return "Mock" if self.use_mock else ("Google Gemini" if self.provider == "gemini" else "GPT-4 Mini")
 
 
 def main():
@@ -259,8 +215,8 @@ def main():
     # Classify jobs
     classified_jobs = classifier.batch_classify(jobs)
 
-    # Filter by relevance
-    relevant_jobs = classifier.filter_by_relevance(classified_jobs)
+    # Filter by relevance (stats come from the same pass)
+    relevant_jobs, stats = classifier.summarize_and_filter(classified_jobs)
 
     # Show results
     print("\n📊 CLASSIFICATION RESULTS:")
@@ -276,7 +232,6 @@ def main():
 
     # Show stats
     print("\n" + "=" * 70)
-    stats = classifier.get_classification_stats(classified_jobs)
     print("📈 CLASSIFICATION STATISTICS:")
     print(f"   Total jobs: {stats['total_jobs']}")
     print(f"   Average relevance: {stats['avg_relevance']:.2f}")
@@ -0,0 +1,240 @@
+"""
+Shared Classifier Plumbing
+
+Pieces both job classifiers (classification.py, classification_gemini.py)
+use, plus the OpenAI client cache every classifier module shares:
+1. One OpenAI client per API key (pooled connections)
+2. Keyword pre-screen before any API call
+3. Duplicate-posting grouping
+4. Concurrent batch classification
+5. Relevance filtering and stats (one pass)
+"""
+
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.keywords import HIRING_KEYWORDS, MIN_RELEVANCE_SCORE
+
+# Jobs classified concurrently against the API (each job is one request)
+CLASSIFY_WORKERS = 8
+
+# Fields classify_job writes, copied from one posting to its duplicates
+_CLASSIFIED_FIELDS = ("relevance_score", "job_category", "classification_confidence", "company_name")
+
+# Cheap pre-screen before any API call: postings that matched no hiring
+# keyword and mention none of these terms are scored as not relevant locally.
+# Whole words only (plus plural/-ed/-er/-ing forms); the vulnerab- stem stays
+# open-ended on purpose
+_SECURITY_TEXT_RE = re.compile(
+    r"\b(?:security|secops|appsec|devsecops|compliance|grc|iam|identity|threat|"
+    r"incident response|soc ?2|iso ?27001|sspm|casb|zero trust|"
+    + "|".join(re.escape(k) for keywords in HIRING_KEYWORDS.values() for k in keywords)
+    + r")(?:s|es|ed|er|ers|ing)?\b|\bvulnerab",
+    re.I,
+)
+
+
+@lru_cache(maxsize=None)
+def openai_client(api_key: str):
+    """OpenAI client per API key, shared by every classifier so its HTTP connection pool is reused"""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+class JobBatchingMixin:
+    """
+    Batch classification for job classifiers
+
+    The classifier provides use_mock, classify_job(job) and
+    _mock_classify(job), and calls _init_batching() from __init__.
+    """
+
+    def _init_batching(self):
+        """Set up the state batch_classify shares with its worker threads"""
+        # Set by a worker that hit the API quota; other workers fall back to
+        # mock scoring, and use_mock is switched once the pool has finished
+        self._quota_exhausted = threading.Event()
+
+    def _provider_name(self) -> str:
+        """Label for progress output"""
+        return "mock classifier" if self.use_mock else "GPT-4 Mini"
+
+    def batch_classify(self, jobs: List[Dict], batch_size: int = 10) -> List[Dict]:
+        """
+        Classify multiple jobs
+
+        With the API, jobs that fail the keyword pre-screen are scored 0.0
+        locally, duplicate postings are sent once, and up to CLASSIFY_WORKERS
+        requests run at once.
+
+        Args:
+            jobs: List of job dictionaries
+            batch_size: Number of jobs to process before showing progress
+
+        Returns:
+            List of classified jobs (input order)
+        """
+        print(f"\n🤖 Classifying {len(jobs)} jobs with {self._provider_name()}...")
+
+        if self.use_mock:
+            groups = [[i] for i in range(len(jobs))]
+        else:
+            # Only postings that pass the pre-screen go to the API
+            candidates = []
+            for i, job in enumerate(jobs):
+                if self._passes_prefilter(job):
+                    candidates.append(i)
+                else:
+                    job["relevance_score"] = 0.0
+                    job["classification_confidence"] = "prefilter"
+
+            if len(candidates) < len(jobs):
+                print(f"   Skipped {len(jobs) - len(candidates)} jobs with no security keywords (scored 0.0)")
+
+            # Identical postings (reposts, HN/Reddit cross-posts) build the same
+            # prompt, so only the first of each group goes to the API
+            groups = self._group_duplicates(jobs, candidates)
+            if len(groups) < len(candidates):
+                print(f"   {len(candidates) - len(groups)} duplicate postings will reuse an earlier result")
+
+        # API calls are network-bound, so up to CLASSIFY_WORKERS run at once;
+        # mock scoring is local and stays on a single worker
+        workers = 1 if self.use_mock else min(CLASSIFY_WORKERS, max(1, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            firsts = ((group[0], jobs[group[0]]) for group in groups)
+            for n, _ in enumerate(executor.map(self._classify_indexed, firsts), 1):
+                if n % batch_size == 0:
+                    print(f"   Processed {n}/{len(groups)} jobs...")
+
+        # Workers only flag the quota; later calls go straight to mock
+        if self._quota_exhausted.is_set():
+            self.use_mock = True
+
+        # Jobs are classified in place; copy each result onto its duplicates
+        for first, *duplicates in groups:
+            for i in duplicates:
+                for field in _CLASSIFIED_FIELDS:
+                    if field in jobs[first]:
+                        jobs[i][field] = jobs[first][field]
+
+        print(f"✅ Classification complete!\n")
+        return list(jobs)
+
+    def _passes_prefilter(self, job_data: Dict) -> bool:
+        """True if the job matched a hiring keyword or mentions a security term"""
+        if job_data.get("matched_keywords"):
+            return True
+
+        text = " ".join((job_data.get("job_title") or "", job_data.get("raw_text") or ""))
+        return bool(_SECURITY_TEXT_RE.search(text))
+
+    def _group_duplicates(self, jobs: List[Dict], indices: List[int]) -> List[List[int]]:
+        """Group job indices by the fields the classification prompt is built from"""
+        groups = {}
+        for i in indices:
+            job = jobs[i]
+            key = (
+                job.get("company_name", "Unknown"),
+                job.get("job_title", "Unknown"),
+                job.get("raw_text", "")[:500],
+                tuple(job.get("matched_keywords", [])),
+            )
+            groups.setdefault(key, []).append(i)
+        return list(groups.values())
+
+    def _classify_indexed(self, indexed_job) -> Dict:
+        """Classify one (index, job) pair, falling back to a default score on error"""
+        i, job = indexed_job
+        try:
+            if self._quota_exhausted.is_set():
+                return self._mock_classify(job)
+            return self.classify_job(job)
+        except Exception as e:
+            print(f"⚠️  Error classifying job {i}: {e}")
+            job["relevance_score"] = 0.5
+            return job
+
+    def filter_by_relevance(self, jobs: List[Dict], min_score: Optional[float] = None) -> List[Dict]:
+        """
+        Filter jobs by relevance score
+
+        Args:
+            jobs: List of classified jobs
+            min_score: Minimum relevance score (default from config)
+
+        Returns:
+            Filtered list of jobs
+        """
+        return self.summarize_and_filter(jobs, min_score)[0]
+
+    def get_classification_stats(self, jobs: List[Dict]) -> Dict:
+        """Get statistics about classified jobs"""
+        return self._summarize(jobs, None)[1]
+
+    def summarize_and_filter(self, jobs: List[Dict], min_score: Optional[float] = None) -> Tuple[List[Dict], Dict]:
+        """
+        Filter jobs by relevance and gather classification stats in one pass
+
+        Args:
+            jobs: List of classified jobs
+            min_score: Minimum relevance score (default from config)
+
+        Returns:
+            (filter_by_relevance result, get_classification_stats result)
+        """
+        min_score = min_score or MIN_RELEVANCE_SCORE
+        relevant, stats = self._summarize(jobs, min_score)
+
+        print(f"🔍 Filtered: {len(relevant)}/{len(jobs)} jobs above {min_score} relevance score")
+        return relevant, stats
+
+    def _summarize(self, jobs: List[Dict], min_score: Optional[float]) -> Tuple[List[Dict], Dict]:
+        """
+        Single pass behind the filter and stats methods
+
+        Returns:
+            (jobs scoring at least min_score, or [] when min_score is None;
+             stats dict, or {} for no jobs)
+        """
+        relevant = []
+        total_relevance = 0
+        high = medium = low = 0
+        by_category = Counter()
+
+        for job in jobs:
+            score = job.get("relevance_score", 0)
+            total_relevance += score
+
+            # Relevance bands: high >= 0.8 > medium >= 0.6 > low
+            if score >= 0.8:
+                high += 1
+            elif score >= 0.6:
+                medium += 1
+            else:
+                low += 1
+            by_category[job.get("job_category", "Unknown")] += 1
+
+            if min_score is not None and score >= min_score:
+                relevant.append(job)
+
+        if not jobs:
+            return relevant, {}
+
+        stats = {
+            "total_jobs": len(jobs),
+            "avg_relevance": total_relevance / len(jobs),
+            "high_relevance": high,
+            "medium_relevance": medium,
+            "low_relevance": low,
+            "by_category": dict(by_category),
+        }
+        return relevant, stats
@@ -14,6 +14,10 @@ vs hiring signals.
 import os
 import json
 import re
+from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 import sys
@@ -22,10 +26,41 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.keywords import CONVERSATION_TOPICS
+from processors.classifier_common import openai_client
 
 # Load environment variables
 load_dotenv()
 
+# Batches of conversations classified concurrently (each batch is one API request)
+BATCH_WORKERS = 4
+
+# Completion budget per conversation (a batch gets this times its size)
+MAX_TOKENS_PER_CONVERSATION = 200
+
+# Cheap pre-filter before any API call: content mentioning none of the topic
+# keywords or these security terms is scored as not relevant without the model.
+# Whole words only (plus plural/-ed/-er/-ing forms), so "hack" doesn't match
+# "shackle"; the vulnerab-/compromis- stems stay open-ended on purpose
+_SECURITY_TEXT_RE = re.compile(
+    r"\b(?:security|threat|attack|breach|ransomware|malware|phishing|zero-day|"
+    r"exploit|cve-\d+|hack|leak|sspm|casb|saas|okta|salesforce|compliance|"
+    + "|".join(re.escape(k) for keywords in CONVERSATION_TOPICS.values() for k in keywords)
+    + r")(?:s|es|ed|er|ers|ing)?\b|\b(?:vulnerab|compromis)",
+    re.I,
+)
+
+_EVALUATION_CRITERIA = """1. Relevance score (0.0 to 1.0) - How relevant is this to SaaS security, SSPM, SaaS breaches, or AI agent security?
+2. Urgency: "breaking" (active breach/critical news), "high" (important update), "normal" (general discussion), or "low" (not timely)
+3. Trending potential: "high" (likely to go viral), "medium" (moderate interest), or "low" (niche topic)
+4. Key insights: List 1-2 key takeaways (brief)"""
+
+_SCORING_GUIDE = """Scoring guide:
+- 0.9-1.0: Active SaaS breach, critical SSPM vulnerability, major AI agent security issue
+- 0.7-0.9: Important SaaS security news, SSPM product launches, compliance updates
+- 0.5-0.7: General SaaS security discussion, tool recommendations
+- 0.3-0.5: Tangentially related cloud/security topics
+- 0.0-0.3: Not relevant to SaaS security"""
+
 
 class ConversationClassifier:
     """Classify conversations and articles using OpenAI GPT-4o-mini"""
@@ -52,8 +87,7 @@ class ConversationClassifier:
             openai_key = api_key or os.getenv("OPENAI_API_KEY")
             if openai_key and not openai_key.startswith("sk-your"):
                 try:
-                    from openai import OpenAI
-                    self.client = OpenAI(api_key=openai_key)
+                    self.client = openai_client(openai_key)
                     self.provider = "openai"
                     print("✅ OpenAI GPT-4 Mini initialized")
                     return
@@ -82,12 +116,7 @@ class ConversationClassifier:
 
         try:
             result = self._classify_with_openai(prompt)
-
-            # Update conversation data
-            conversation_data["relevance_score"] = float(result.get("relevance_score", 0.5))
-            conversation_data["urgency"] = result.get("urgency", "normal")
-            conversation_data["trending_potential"] = result.get("trending_potential", "low")
-            conversation_data["key_insights"] = result.get("key_insights", [])
+            self._apply_classification(conversation_data, result)
 
         except Exception as e:
             print(f"⚠️  Classification error: {e}")
@@ -98,9 +127,64 @@ class ConversationClassifier:
 
         return conversation_data
 
+    def _passes_prefilter(self, conversation_data: Dict) -> bool:
+        """True if the conversation has matched keywords or mentions a security term"""
+        if conversation_data.get("matched_keywords"):
+            return True
+
+        text = " ".join((
+            conversation_data.get("title") or "",
+            conversation_data.get("content") or conversation_data.get("summary") or "",
+        ))
+        return bool(_SECURITY_TEXT_RE.search(text))
+
+    def _apply_classification(self, conversation_data: Dict, result: Dict):
+        """Copy one model result onto the conversation"""
+        conversation_data["relevance_score"] = float(result.get("relevance_score", 0.5))
+        conversation_data["urgency"] = result.get("urgency", "normal")
+        conversation_data["trending_potential"] = result.get("trending_potential", "low")
+        conversation_data["key_insights"] = result.get("key_insights", [])
+
+    def _classify_batch(self, conversations: List[Dict]) -> List[Dict]:
+        """
+        Classify several conversations with a single API request
+
+        Conversations the response does not cover (or a failed request) fall
+        back to one request each via classify_conversation.
+
+        Args:
+            conversations: Conversations to classify together
+
+        Returns:
+            The same conversations, classified, in order
+        """
+        results = {}
+        try:
+            response = self._classify_with_openai(
+                self._build_batch_prompt(conversations),
+                max_tokens=MAX_TOKENS_PER_CONVERSATION * len(conversations),
+            )
+            for result in response.get("results", []):
+                if isinstance(result, dict) and "id" in result:
+                    results[str(result["id"])] = result
+        except Exception as e:
+            print(f"⚠️  Batch classification error, classifying one by one: {e}")
+
+        for i, conversation in enumerate(conversations):
+            result = results.get(str(i))
+            if result is None:
+                self.classify_conversation(conversation)
+                continue
+            try:
+                self._apply_classification(conversation, result)
+            except (TypeError, ValueError):
+                self.classify_conversation(conversation)
+
+        return conversations
+
     # Removed Gemini integration; classification uses OpenAI by default.
 
-    def _classify_with_openai(self, prompt: str) -> Dict:
+    def _classify_with_openai(self, prompt: str, max_tokens: int = MAX_TOKENS_PER_CONVERSATION) -> Dict:
         """Classify using OpenAI GPT-4 Mini"""
         response = self.client.chat.completions.create(
             model="gpt-4o-mini",
@@ -112,13 +196,65 @@ class ConversationClassifier:
                 {"role": "user", "content": prompt},
             ],
             temperature=0.1,
-            max_tokens=200,
+            max_tokens=max_tokens,
             response_format={"type": "json_object"},
         )
         return json.loads(response.choices[0].message.content)
 
     def _build_classification_prompt(self, conversation_data: Dict) -> str:
         """Build prompt for AI classification"""
+        prompt = f"""Analyze this cybersecurity content for relevance to SaaS Security:
+
+{self._describe_conversation(conversation_data)}
+
+Evaluate:
+{_EVALUATION_CRITERIA}
+
+Return ONLY valid JSON with this exact structure (no markdown):
+{{
+    "relevance_score": 0.85,
+    "urgency": "high",
+    "trending_potential": "medium",
+    "key_insights": ["Brief insight 1", "Brief insight 2"]
+}}
+
+{_SCORING_GUIDE}"""
+
+        return prompt
+
+    def _build_batch_prompt(self, conversations: List[Dict]) -> str:
+        """Build one prompt covering several conversations (results keyed by item id)"""
+        items = "\n\n".join(
+            f"[Item {i}]\n{self._describe_conversation(conversation)}"
+            for i, conversation in enumerate(conversations)
+        )
+
+        prompt = f"""Analyze each of these {len(conversations)} cybersecurity items for relevance to SaaS Security:
+
+{items}
+
+For each item, evaluate:
+{_EVALUATION_CRITERIA}
+
+Return ONLY valid JSON with this exact structure (no markdown), one entry per item with its id:
+{{
+    "results": [
+        {{
+            "id": 0,
+            "relevance_score": 0.85,
+            "urgency": "high",
+            "trending_potential": "medium",
+            "key_insights": ["Brief insight 1", "Brief insight 2"]
+        }}
+    ]
+}}
+
+{_SCORING_GUIDE}"""
+
+        return prompt
+
+    def _describe_conversation(self, conversation_data: Dict) -> str:
+        """Context, title, keywords and content lines for a prompt"""
         platform = conversation_data.get("platform", "unknown")
         title = conversation_data.get("title", "Unknown")
         content = conversation_data.get("content", conversation_data.get("summary", ""))[:500]
@@ -135,35 +271,10 @@ class ConversationClassifier:
         else:
             context = "Content"
 
-        prompt = f"""Analyze this cybersecurity content for relevance to SaaS Security:
-
-{context}
+        return f"""{context}
 Title: {title}
 Matched Keywords: {keywords}
-Content: {content}
-
-Evaluate:
-1. Relevance score (0.0 to 1.0) - How relevant is this to SaaS security, SSPM, SaaS breaches, or AI agent security?
-2. Urgency: "breaking" (active breach/critical news), "high" (important update), "normal" (general discussion), or "low" (not timely)
-3. Trending potential: "high" (likely to go viral), "medium" (moderate interest), or "low" (niche topic)
-4. Key insights: List 1-2 key takeaways (brief)
-
-Return ONLY valid JSON with this exact structure (no markdown):
-{{
-    "relevance_score": 0.85,
-    "urgency": "high",
-    "trending_potential": "medium",
-    "key_insights": ["Brief insight 1", "Brief insight 2"]
-}}
-
-Scoring guide:
-- 0.9-1.0: Active SaaS breach, critical SSPM vulnerability, major AI agent security issue
-- 0.7-0.9: Important SaaS security news, SSPM product launches, compliance updates
-- 0.5-0.7: General SaaS security discussion, tool recommendations
-- 0.3-0.5: Tangentially related cloud/security topics
-- 0.0-0.3: Not relevant to SaaS security"""
-
-        return prompt
+Content: {content}"""
 
     def _mock_classify(self, conversation_data: Dict) -> Dict:
         """Mock classification (for testing without API key)"""
@@ -216,12 +327,56 @@ Scoring guide:
         return conversation_data
 
     def batch_classify(self, conversations: List[Dict], batch_size: int = 10) -> List[Dict]:
-        """Classify multiple conversations"""
+        """
+        Classify multiple conversations
+
+        With the API, conversations that fail the keyword pre-filter are scored
+        0.0 locally; the rest go out batch_size per request, with up to
+        BATCH_WORKERS batches in flight at once.
+
+        Args:
+            conversations: List of conversation dictionaries
+            batch_size: Conversations per API request (and per progress line)
+
+        Returns:
+            List of classified conversations (input order)
+        """
         provider_name = "Mock" if self.use_mock else (
             "Google Gemini" if self.provider == "gemini" else "GPT-4 Mini"
         )
         print(f"\n🤖 Classifying {len(conversations)} conversations with {provider_name}...")
 
+        if not self.use_mock and conversations:
+            # Only content that passes the keyword pre-filter goes to the model
+            candidates = []
+            skipped = 0
+            for conversation in conversations:
+                if self._passes_prefilter(conversation):
+                    candidates.append(conversation)
+                else:
+                    self._apply_classification(conversation, {
+                        "relevance_score": 0.0,
+                        "urgency": "low",
+                        "trending_potential": "low",
+                    })
+                    skipped += 1
+
+            if skipped:
+                print(f"   Skipped {skipped} conversations with no security keywords (scored 0.0)")
+
+            batches = [candidates[i:i + batch_size] for i in range(0, len(candidates), batch_size)]
+
+            processed = 0
+            if batches:
+                with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(batches))) as executor:
+                    for classified_batch in executor.map(self._classify_batch, batches):
+                        processed += len(classified_batch)
+                        print(f"   Processed {processed}/{len(candidates)} conversations...")
+
+            # Conversations are classified in place, so input order is kept
+            print(f"✅ Classification complete!\n")
+            return list(conversations)
+
         classified_conversations = []
         for i, conversation in enumerate(conversations):
             try:
@@ -253,10 +408,10 @@ Scoring guide:
     ) -> List[Dict]:
         """Get top trending conversations"""
         # Sort by relevance + trending potential
+        trending_map = {"high": 0.3, "medium": 0.15, "low": 0}
         scored = []
         for conv in conversations:
             relevance = conv.get("relevance_score", 0)
-            trending_map = {"high": 0.3, "medium": 0.15, "low": 0}
             trending_boost = trending_map.get(conv.get("trending_potential", "low"), 0)
 
             # Engagement boost for Reddit
@@ -269,9 +424,8 @@ Scoring guide:
             total_score = relevance + trending_boost
             scored.append((total_score, conv))
 
-        # Sort and return top N
-        scored.sort(reverse=True, key=lambda x: x[0])
-        return [conv for _, conv in scored[:limit]]
+        # Partial sort for the top N (same order as a full descending sort)
+        return [conv for _, conv in nlargest(limit, scored, key=itemgetter(0))]
 
     def get_classification_stats(self, conversations: List[Dict]) -> Dict:
         """Get statistics about classified conversations"""
@@ -286,32 +440,12 @@ Scoring guide:
             "high_relevance": sum(1 for score in relevance_scores if score >= 0.8),
             "medium_relevance": sum(1 for score in relevance_scores if 0.6 <= score < 0.8),
             "low_relevance": sum(1 for score in relevance_scores if score < 0.6),
-            "by_urgency": {},
-            "by_trending": {},
-            "by_platform": {},
-            "by_category": {},
+            "by_urgency": dict(Counter(c.get("urgency", "normal") for c in conversations)),
+            "by_trending": dict(Counter(c.get("trending_potential", "low") for c in conversations)),
+            "by_platform": dict(Counter(c.get("platform", "unknown") for c in conversations)),
+            "by_category": dict(Counter(c.get("category", "Unknown") for c in conversations)),
         }
 
-        # Count by urgency
-        for conv in conversations:
-            urgency = conv.get("urgency", "normal")
-            stats["by_urgency"][urgency] = stats["by_urgency"].get(urgency, 0) + 1
-
-        # Count by trending potential
-        for conv in conversations:
-            trending = conv.get("trending_potential", "low")
-            stats["by_trending"][trending] = stats["by_trending"].get(trending, 0) + 1
-
-        # Count by platform
-        for conv in conversations:
-            platform = conv.get("platform", "unknown")
-            stats["by_platform"][platform] = stats["by_platform"].get(platform, 0) + 1
-
-        # Count by category
-        for conv in conversations:
-            category = conv.get("category", "Unknown")
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
-
         return stats
 
 
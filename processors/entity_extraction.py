@@ -11,6 +11,9 @@ This enriches scraped job posts with structured data.
 
 import spacy
 import re
+import hashlib
+import shelve
+from functools import lru_cache
 from typing import Dict, List, Optional
 import sys
 import os
@@ -20,25 +23,115 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.keywords import JOB_TITLE_PATTERNS
 
+# Only the head of each post is run through spaCy
+_MAX_NLP_CHARS = 1000
+
+
+def _env_int(name: str, default: int) -> int:
+    """Positive integer from an environment variable, or default if unset/invalid"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        print(f"⚠️  Ignoring {name}={value!r} (expected a positive integer), using {default}")
+        return default
+    return number
+
+
+# Docs per nlp.pipe batch in batch_extract
+SPACY_BATCH_SIZE = _env_int("SPACY_BATCH_SIZE", 64)
+
+# Worker processes for nlp.pipe. Opt-in (each worker reloads the model, and
+# spawn platforms need the caller's __main__ guard), and used only once a
+# batch is big enough to pay for starting them
+SPACY_PROCESSES = _env_int("SPACY_PROCESSES", 1)
+_MIN_DOCS_PER_PROCESS = 32
+
+# Only doc.ents is read, so skip the pipeline components that feed nothing else
+_SPACY_EXCLUDE = ["parser", "lemmatizer", "attribute_ruler"]
+
+# Patterns applied to every job post, compiled once at import
+_COMPANY_SUFFIX_RES = [
+    re.compile(r"\s+(Inc\.?|LLC|Ltd\.?|Corp\.?|Corporation|Co\.?|Company)$", re.IGNORECASE),
+    re.compile(r"\s+\([^)]+\)$", re.IGNORECASE),  # Remove parenthetical info
+]
+_LEADING_COMPANY_RE = re.compile(r"^([A-Z][A-Za-z0-9\s&\.]{2,40})")
+_LEADING_ARTICLE_RE = re.compile(r"^(The|A|An)\s+", re.IGNORECASE)
+_JOB_TITLE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in JOB_TITLE_PATTERNS]
+
+# Additional patterns for common titles
+_COMMON_TITLE_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in [
+        r"(Senior|Staff|Principal|Lead)?\s*(Security|Software|DevOps|Cloud|Application)\s+Engineer",
+        r"(Senior|Staff|Principal)?\s*Security\s+Architect",
+        r"(Senior|Staff)?\s*(Security|Compliance|GRC)\s+Analyst",
+        r"(Senior|Staff|Principal)?\s*Security\s+Researcher",
+    ]
+]
+
+
+# Company names repeat across posts (same company, many openings), so the
+# cleaning helpers are pure functions of the name and memoized
+@lru_cache(maxsize=4096)
+def _clean_company_name(company: str) -> str:
+    """Clean and normalize company name"""
+    # Remove common suffixes
+    for pattern in _COMPANY_SUFFIX_RES:
+        company = pattern.sub("", company)
+
+    # Remove extra whitespace
+    company = " ".join(company.split())
+
+    # Remove leading articles
+    company = _LEADING_ARTICLE_RE.sub("", company)
+
+    return company.strip()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_company_name(company: str) -> str:
+    """Lowercase, suffix-free, whitespace-collapsed company name for matching"""
+    normalized = company.lower().strip()
+
+    # Remove common suffixes for better matching
+    for pattern in _COMPANY_SUFFIX_RES:
+        normalized = pattern.sub("", normalized)
+
+    # Remove extra whitespace
+    normalized = " ".join(normalized.split())
+
+    return normalized
+
 
 class EntityExtractor:
     """Extract structured entities from job post text using spaCy NLP"""
 
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None, n_process: Optional[int] = None):
+        """
+        Initialize extractor
+
+        Args:
+            cache_path: shelve file of earlier NER results keyed by post text, so
+                re-runs over the same posts skip spaCy (default: NER_CACHE_PATH
+                env var, or no cache)
+            n_process: spaCy worker processes for large batches (default:
+                SPACY_PROCESSES env var, or 1 = in-process)
+        """
+        self.cache_path = cache_path or os.getenv("NER_CACHE_PATH")
+        self.n_process = max(1, n_process or SPACY_PROCESSES)
+
         print("🧠 Loading spaCy model...")
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=_SPACY_EXCLUDE)
             print("✅ spaCy model loaded successfully")
         except OSError:
             print("❌ spaCy model not found. Run: python -m spacy download en_core_web_sm")
             raise
 
-        # Company name cleaning patterns
-        self.company_suffixes = [
-            r"\s+(Inc\.?|LLC|Ltd\.?|Corp\.?|Corporation|Co\.?|Company)$",
-            r"\s+\([^)]+\)$",  # Remove parenthetical info
-        ]
-
     def extract_entities(self, job_data: Dict) -> Dict:
         """
         Extract all entities from a job posting
@@ -55,11 +148,22 @@ class EntityExtractor:
             return job_data
 
         # Process text with spaCy
-        doc = self.nlp(text[:1000])  # Limit to first 1000 chars for performance
+        doc = self.nlp(text[:_MAX_NLP_CHARS])  # Limit to first 1000 chars for performance
+
+        return self._apply_entities(job_data, self._doc_entities(doc, text), text)
 
+    def _doc_entities(self, doc, text: str) -> Dict:
+        """NER-derived company and location for a post (what the NER cache stores)"""
+        return {
+            "company": self.extract_company(doc, text),
+            "location": self.extract_location(doc),
+        }
+
+    def _apply_entities(self, job_data: Dict, entities: Dict, text: str) -> Dict:
+        """Fill in company, title, location and normalized name from NER results"""
         # Extract company if not already present
         if not job_data.get("company_name"):
-            company = self.extract_company(doc, text)
+            company = entities["company"]
             if company:
                 job_data["company_name"] = company
 
@@ -71,7 +175,7 @@ class EntityExtractor:
 
         # Extract location if not present
         if not job_data.get("location"):
-            location = self.extract_location(doc)
+            location = entities["location"]
             if location:
                 job_data["location"] = location
 
@@ -109,7 +213,7 @@ class EntityExtractor:
                 return company
 
         # Fallback: Try to find company at start of text
-        match = re.match(r"^([A-Z][A-Za-z0-9\s&\.]{2,40})", text)
+        match = _LEADING_COMPANY_RE.match(text)
         if match:
             company = match.group(1).strip()
             company = self.clean_company_name(company)
@@ -120,17 +224,7 @@ class EntityExtractor:
 
     def clean_company_name(self, company: str) -> str:
         """Clean and normalize company name"""
-        # Remove common suffixes
-        for pattern in self.company_suffixes:
-            company = re.sub(pattern, "", company, flags=re.IGNORECASE)
-
-        # Remove extra whitespace
-        company = " ".join(company.split())
-
-        # Remove leading articles
-        company = re.sub(r"^(The|A|An)\s+", "", company, flags=re.IGNORECASE)
-
-        return company.strip()
+        return _clean_company_name(company)
 
     def normalize_company_name(self, company: str) -> str:
         """
@@ -138,16 +232,7 @@ class EntityExtractor:
 
         Returns lowercase, trimmed version for matching
         """
-        normalized = company.lower().strip()
-
-        # Remove common suffixes for better matching
-        for pattern in self.company_suffixes:
-            normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
-
-        # Remove extra whitespace
-        normalized = " ".join(normalized.split())
-
-        return normalized
+        return _normalize_company_name(company)
 
     def extract_job_title(self, text: str) -> Optional[str]:
         """
@@ -159,8 +244,8 @@ class EntityExtractor:
         Returns:
             Job title or None
         """
-        for pattern in JOB_TITLE_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _JOB_TITLE_RES:
+            match = pattern.search(text)
             if match:
                 title = match.group(0)
                 # Clean up the title
@@ -169,15 +254,8 @@ class EntityExtractor:
                     return title
 
         # Additional patterns for common titles
-        common_titles = [
-            r"(Senior|Staff|Principal|Lead)?\s*(Security|Software|DevOps|Cloud|Application)\s+Engineer",
-            r"(Senior|Staff|Principal)?\s*Security\s+Architect",
-            r"(Senior|Staff)?\s*(Security|Compliance|GRC)\s+Analyst",
-            r"(Senior|Staff|Principal)?\s*Security\s+Researcher",
-        ]
-
-        for pattern in common_titles:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMMON_TITLE_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
 
@@ -214,30 +292,92 @@ class EntityExtractor:
         """
         print(f"\n🔍 Extracting entities from {len(jobs)} jobs...")
 
-        enhanced_jobs = []
+        enhanced_jobs = list(jobs)
+        cache = self._open_cache()
+
+        # Jobs without text pass through untouched, cached posts reuse their
+        # stored NER results, and the rest go through nlp.pipe so spaCy
+        # batches the docs instead of one call per job
+        texts = []
+        cached = 0
         for i, job in enumerate(jobs):
-            try:
-                enhanced_job = self.extract_entities(job)
-                enhanced_jobs.append(enhanced_job)
+            text = job.get("raw_text")
+            if not text:
+                continue
 
-                if (i + 1) % 10 == 0:
-                    print(f"   Processed {i + 1}/{len(jobs)} jobs...")
+            key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest() if cache is not None else None
+            entities = cache.get(key) if cache is not None else None
+            if entities is None:
+                texts.append((text[:_MAX_NLP_CHARS], (i, key)))
+                continue
 
+            cached += 1
+            try:
+                enhanced_jobs[i] = self._apply_entities(job, entities, text)
             except Exception as e:
                 print(f"⚠️  Error processing job {i}: {e}")
-                enhanced_jobs.append(job)  # Include original on error
+
+        if cached:
+            print(f"   ♻️  Reused cached entities for {cached} jobs")
+
+        try:
+            n_process = self.n_process if len(texts) > _MIN_DOCS_PER_PROCESS else 1
+            docs = self.nlp.pipe(texts, batch_size=SPACY_BATCH_SIZE, as_tuples=True, n_process=n_process)
+
+            for n, (doc, (i, key)) in enumerate(docs, 1):
+                job = jobs[i]
+                try:
+                    entities = self._doc_entities(doc, job["raw_text"])
+                    if cache is not None:
+                        cache[key] = entities
+                    enhanced_jobs[i] = self._apply_entities(job, entities, job["raw_text"])
+                except Exception as e:
+                    print(f"⚠️  Error processing job {i}: {e}")
+
+                if n % 10 == 0:
+                    print(f"   Processed {n}/{len(texts)} jobs...")
+        finally:
+            if cache is not None:
+                cache.close()
 
         print(f"✅ Entity extraction complete!\n")
         return enhanced_jobs
 
+    def _open_cache(self):
+        """Open the on-disk NER cache, or None when caching is off or unavailable"""
+        if not self.cache_path:
+            return None
+
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            return shelve.open(self.cache_path)
+        except Exception as e:
+            print(f"⚠️  NER cache unavailable: {e}")
+            return None
+
     def get_extraction_stats(self, jobs: List[Dict]) -> Dict:
-        """Get statistics about extracted entities"""
+        """Get statistics about extracted entities (one pass over the jobs)"""
+        with_title = 0
+        with_location = 0
+        companies = []
+
+        for j in jobs:
+            company = j.get("company_name")
+            if company:
+                companies.append(company)
+            if j.get("job_title"):
+                with_title += 1
+            if j.get("location"):
+                with_location += 1
+
         stats = {
             "total_jobs": len(jobs),
-            "with_company": sum(1 for j in jobs if j.get("company_name")),
-            "with_title": sum(1 for j in jobs if j.get("job_title")),
-            "with_location": sum(1 for j in jobs if j.get("location")),
-            "unique_companies": len(set(j.get("company_name") for j in jobs if j.get("company_name"))),
+            "with_company": len(companies),
+            "with_title": with_title,
+            "with_location": with_location,
+            "unique_companies": len(set(companies)),
         }
         return stats
 
@@ -11,13 +11,23 @@ NEW STRATEGY:
 NO GOOGLE SEARCH - All direct scraping!
 """
 
+import os
+import shelve
+import json
 import requests
-from bs4 import BeautifulSoup
+import feedparser
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 import time
 from typing import List, Dict, Set
 import re
-from urllib.parse import urljoin
+import threading
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -26,6 +36,351 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import requests_cache  # Optional - on-disk HTTP cache for development re-runs
+except ImportError:
+    requests_cache = None
+
+
+# Statuses worth retrying with backoff (throttling / transient server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# ATS probe results (board exists / doesn't) are trusted for a week
+ATS_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Cached HTTP responses (opt-in, see http_cache_path) are reused for an hour
+HTTP_CACHE_TTL_SECONDS = 3600
+
+# ATS vendors whose customers are separate tenants. The rate limiter keys
+# these on the full host ({company}.bamboohr.com, acme.wd1.myworkdayjobs.com)
+# instead of one shared slot for the whole vendor
+_ATS_TENANT_DOMAINS = frozenset({
+    'myworkdayjobs.com', 'bamboohr.com', 'greenhouse.io', 'lever.co', 'ashbyhq.com', 'smartrecruiters.com',
+})
+
+# Vendors that put every tenant under one host (boards.greenhouse.io/{slug})
+# sit behind CDNs and get a shorter gap than DomainRateLimiter's default
+ATS_HOST_INTERVALS = {
+    'boards.greenhouse.io': 0.02,
+    'jobs.lever.co': 0.02,
+    'jobs.ashbyhq.com': 0.02,
+    'careers.smartrecruiters.com': 0.02,
+}
+
+# A checkpoint is only resumed by the same run ID, and only for a day - a
+# crash from an earlier week is discarded instead of leaking into this one
+CHECKPOINT_TTL_SECONDS = 24 * 3600
+
+# Patterns used inside per-page / per-candidate loops, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_SLUG_STRIP_TIGHT_RE = re.compile(r'[^a-z0-9]+')
+
+# Byte deletion tables for slugs that only drop characters (one C-level pass)
+_SLUG_CHARS = b'abcdefghijklmnopqrstuvwxyz0123456789'
+_SLUG_DELETE_TIGHT = bytes(b for b in range(256) if b not in _SLUG_CHARS)
+_SLUG_DELETE = bytes(b for b in range(256) if b not in _SLUG_CHARS + b'-')
+
+# Indeed job cards
+_COMPANY_CLASS_RE = re.compile(r'company', re.I)
+_TITLE_CLASS_RE = re.compile(r'title', re.I)
+_INDEED_COMPANY_TEXT_RE = re.compile(r'(?:at|by)\s+([A-Z][A-Za-z0-9\s\.\-&]{2,50})')
+_INDEED_JOB_LINK_RE = re.compile(r'/rc/clk|/viewjob')
+
+# VC portfolio pages
+_VC_CONTAINER_CLASS_RES = [re.compile(r'company|portfolio|startup'), re.compile(r'card|item|grid-item')]
+_VC_NAME_CHARS_RE = re.compile(r'^[A-Za-z0-9\s\.\-&]+$')
+_VC_SKIP_HREF_PARTS = ('twitter', 'linkedin', 'facebook', 'instagram', 'about', 'team', 'contact', 'news')
+
+# ATS boards
+_WORKDAY_JOB_HREF_RE = re.compile(r'/job/')
+_GREENHOUSE_JOB_CLASS_RE = re.compile(r'opening|job')
+_GREENHOUSE_JOB_HREF_RE = re.compile(r'/jobs/\d+')
+_LEVER_JOB_CLASS_RE = re.compile(r'posting|position')
+_LEVER_LINK_CLASS_RE = re.compile(r'posting')
+# Case-insensitive substring match (no \b) so 'Cybersecurity' still hits 'security'
+_SECURITY_TITLE_RE = re.compile(r'security|cyber|infosec|soc|threat|devsecops', re.I)
+_SECURITY_KW_RE = re.compile(r'security|cyber|infosec|soc|threat|devsecops|appsec|cloud\s*security|iam', re.I)
+_SECURITY_KW_NO_IAM_RE = re.compile(r'security|cyber|infosec|soc|threat|devsecops|appsec|cloud\s*security', re.I)
+_HIRING_CAFE_COMPANY_HREF_RE = re.compile(r'/company/|/companies/')
+
+# Security-relevant RSS titles (substring match, like the keyword list it replaced)
+_RSS_SECURITY_RE = re.compile(
+    r'security|threat|vulnerability|attack|breach|ransomware|malware|phishing|zero-day|'
+    r'exploit|cloud|saas|sspm|iam|compliance|encryption',
+    re.I
+)
+
+# Security job boards
+_JOB_CONTAINER_CLASS_RE = re.compile(r'job|listing|position|posting|result', re.I)
+_JOB_LINK_RE = re.compile(r'/job[s]?/|/position[s]?/|/career[s]?/', re.I)
+_COMPANY_ELEM_RE = re.compile(r'company|employer|organization', re.I)
+_COMPANY_TEXT_RE = re.compile(r'(?:at|company:|employer:)\s*([A-Z][A-Za-z0-9\s\.\-&]{2,50})', re.I)
+
+# Parse only the subtrees each scraper reads. Matching tags keep their whole
+# subtree, so container.find()/find_parent('a') behave as on the full page;
+# <head>, scripts and unrelated markup are never built into the tree.
+_INDEED_CARD_STRAINER = SoupStrainer('div', attrs={'class': re.compile(r'(?:^|\s)job_seen_beacon(?:\s|$)')})
+_WORKDAY_JOB_STRAINER = SoupStrainer('a', href=_WORKDAY_JOB_HREF_RE)
+_GREENHOUSE_STRAINER = SoupStrainer(['div', 'a'])
+_LEVER_STRAINER = SoupStrainer(['div', 'a'])
+_JOB_BOARD_STRAINER = SoupStrainer(['div', 'li', 'article', 'a'])
+_ASHBY_STRAINER = SoupStrainer(['a', 'div'])
+_SMARTRECRUITERS_STRAINER = SoupStrainer(['a', 'div', 'h3'])
+_BAMBOOHR_STRAINER = SoupStrainer(['a', 'div', 'li'])
+_HIRING_CAFE_STRAINER = SoupStrainer('a', href=_HIRING_CAFE_COMPANY_HREF_RE)
+
+# Article author extraction
+_AUTHOR_META_RE = re.compile(r'author', re.I)
+_AUTHOR_PATTERNS = [
+    ('div', {'class': re.compile(r'author|byline|writer|posted-by', re.I)}),
+    ('span', {'class': re.compile(r'author|byline|writer|posted-by', re.I)}),
+    ('p', {'class': re.compile(r'author|byline|writer', re.I)}),
+    ('a', {'rel': 'author'}),
+    ('div', {'class': 'author-name'}),
+    ('span', {'class': 'author-name'})
+]
+_AUTHOR_PREFIX_RE = re.compile(r'^(by|written by|author:|posted by|from)\s*', re.I)
+_NUMERIC_DATE_RE = re.compile(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}')
+_NOT_A_NAME_RE = re.compile(r'http|www|\d{4}|january|february|march|april|may|june|july|august|september|october|november|december', re.I)
+_BYLINE_RE = re.compile(r'(?:written by|by|author:)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})')
+
+# Company name validation - UI text fragments that are not company names
+_INVALID_NAME_PATTERNS = [
+    r'\btosign\b', r'\binorcreate\b', r'\baccount\b.*\bsave\b',
+    r'^e\s', r'^e$', r'^e\s+an', r'need\s*to', r'sign\s*in', r'create\s*an',
+    r'POST\s*A\s*JOB', r'apply\s*for', r'maximum\s*exposure',
+    r'^Hiring\s*Companies$', r'^Latest\s*News$', r'Why\s*choose',
+    r'need.*account', r'You\s*need', r'Apply$',
+    r'^ed\s*Today', r'^es\s*to\s*apply', r'^terson\s', r'^ion\s', r'^ions\s',
+    r'See\s*wha$', r'Description\s*See', r'Not\s*Specified',
+    r'Skip to', r'Our (Founders|Companies|Ethos|History)', r'^Stories$', r'^Arc$',
+    r'^Spotlights$', r'^All$', r'^Jobs$', r'^Legal$', r'^Connect$',
+    r'Login$', r'^About$', r'^Team$', r'^Contact$', r'^News$', r'^Blog$', r'^Press$',
+    r'^is\s', r'^est\s', r'Category Manager', r'Intelligence Analyst.*You need',
+    r'Consultant.*You need', r'Manager.*You need', r'Analyst.*You need',
+    r'.*You need tosign', r'Centre$', r'Cyber Security.*Why choose'
+]
+# One alternation so each candidate name is scanned once, not once per pattern
+_INVALID_NAME_RE = re.compile('|'.join(f'(?:{p})' for p in _INVALID_NAME_PATTERNS), re.I)
+
+# Exact (lowercased) names that are navigation/generic text
+_GENERIC_TERMS = frozenset({
+    'job', 'apply', 'save', 'account', 'login', 'sign in',
+    'post a job', 'latest news', 'hiring companies', 'careers',
+    'you need', 'create an account', 'maximum exposure',
+    'ed today', 'ed todayts', 'ed todaysecret', 'terson air force bas',
+    'es to apply for maximum exposure', 'ion engineer', 'e account',
+    'ions centre', 'ion', 'ions analyst', 'est news', 'hiring companies',
+    'skip to main content', 'our founders', 'our companies', 'stories',
+    'arc', 'spotlights', 'all', 'jobs', 'legal', 'sequoia capital',
+    'sequoia heritage', 'sequoia capital global equities', 'lp login',
+    'sequoia ampersand login', 'connect', 'our ethos', 'our history'
+})
+
+# Additional VC-specific false positives
+_VC_FALSE_POSITIVES = frozenset({
+    'view all', 'learn more', 'read more', 'see more', 'portfolio', 'companies',
+    'our founders', 'our companies', 'stories', 'arc', 'spotlights', 'all',
+    'our ethos', 'our history', 'jobs', 'legal', 'connect', 'skip to main content',
+    'lp login', 'login', 'about', 'team', 'contact', 'news', 'blog', 'press'
+})
+_HAS_LETTER_RE = re.compile(r'[A-Za-z]')
+_STARTS_ALNUM_RE = re.compile(r'^[A-Za-z0-9]')
+_COMPANY_SUFFIX_RE = re.compile(r'\s+(Inc\.|LLC|Corp|Corporation|Ltd|Limited|Co\.)$', re.I)
+
+
+# The same names come back from every page and source (one per opening), so
+# validation is a pure function of the name and memoized
+@lru_cache(maxsize=4096)
+def _is_valid_company_name(name: str) -> bool:
+    """Check a scraped name against the length, UI-fragment and generic-text rules"""
+    if not name or len(name) < 2:
+        return False
+
+    # Must be reasonable length (2-100 chars)
+    if len(name) > 100:
+        return False
+
+    # Filter out UI text fragments
+    if _INVALID_NAME_RE.search(name):
+        return False
+
+    # Must contain at least one letter
+    if not _HAS_LETTER_RE.search(name):
+        return False
+
+    # Filter out generic phrases
+    if name.lower().strip() in _GENERIC_TERMS:
+        return False
+
+    # Must start with letter or number (not special char)
+    if not _STARTS_ALNUM_RE.match(name):
+        return False
+
+    return True
+
+
+# (has roles, has posts) -> (activity_type, priority_score) for the tracker
+_ACTIVITY_BY_SIGNAL = {
+    (True, True): ('both', 3),
+    (True, False): ('hiring_only', 2),
+    (False, True): ('talking_only', 1),
+    (False, False): ('discovered', 0),
+}
+
+
+def _is_job_container(tag) -> bool:
+    """Match job listing containers (by class) or links to job pages (by href)"""
+    if tag.name in ('div', 'li', 'article'):
+        classes = tag.get('class')
+        return bool(classes) and bool(_JOB_CONTAINER_CLASS_RE.search(' '.join(classes)))
+    if tag.name == 'a':
+        href = tag.get('href')
+        return bool(href) and bool(_JOB_LINK_RE.search(href))
+    return False
+
+
+def _bounded_text(elem, limit: int):
+    """Stripped text of an element joined like get_text(strip=True), or None once it exceeds limit"""
+    parts = []
+    length = 0
+    for s in elem.itertext():
+        s = s.strip()
+        if s:
+            length += len(s)
+            if length > limit:
+                return None
+            parts.append(s)
+    return ''.join(parts)
+
+
+def _vc_portfolio_names(source) -> List[str]:
+    """
+    Candidate company names from a VC portfolio page, parsed incrementally
+
+    Links come first, then class containers per pattern (the order the
+    BeautifulSoup version produced). Elements are cleared as soon as no
+    open matching link or container still needs their text, so the tree
+    only holds the containers currently being read.
+
+    Args:
+        source: File-like HTML stream (e.g. response.raw)
+
+    Returns:
+        Candidate names (2-50 chars), unvalidated
+    """
+    # One list for links, then one per container pattern. A slot is reserved
+    # when a match opens, so nested matches keep document order, and filled
+    # with its text (or None) when it closes
+    name_lists = [[] for _ in range(len(_VC_CONTAINER_CLASS_RES) + 1)]
+
+    # Reserved slots of the open links/containers (None = not a match); while
+    # any match is open, its subtree must stay intact for its text
+    open_slots = []
+    needed = 0
+
+    for event, elem in etree.iterparse(source, events=('start', 'end'), tag=('a', 'div', 'li', 'article'), html=True):
+        if event == 'start':
+            slots = None
+            if elem.tag == 'a':
+                # Strategy 1: Look for links that might be companies
+                # (skipping navigation/social links)
+                href = elem.get('href')
+                if href is not None and not any(skip in href.lower() for skip in _VC_SKIP_HREF_PARTS):
+                    slots = [(0, len(name_lists[0]))]
+            else:
+                # Strategy 2: Look for company names in specific containers
+                # Common patterns: div.company, div.portfolio-item, li.company-name
+                css_class = elem.get('class')
+                if css_class:
+                    slots = [
+                        (i, len(name_lists[i]))
+                        for i, pattern in enumerate(_VC_CONTAINER_CLASS_RES, 1)
+                        if pattern.search(css_class)
+                    ] or None
+
+            if slots:
+                for i, _ in slots:
+                    name_lists[i].append(None)
+                needed += 1
+            open_slots.append(slots)
+            continue
+
+        slots = open_slots.pop()
+        if slots:
+            needed -= 1
+
+            # Company names are usually 2-50 chars
+            text = _bounded_text(elem, 50)
+            if text and len(text) >= 2 and not (elem.tag == 'a' and text.startswith('#')):
+                for i, position in slots:
+                    name_lists[i][position] = text
+
+        # Nothing still open needs this subtree's text
+        if not needed:
+            elem.clear()
+            parent = elem.getparent()
+            while parent is not None and elem.getprevious() is not None:
+                del parent[0]
+
+    return [name for names in name_lists for name in names if name is not None]
+
+
+@dataclass(slots=True)
+class CompanyRecord:
+    """
+    Signals collected for one company
+
+    Job and post entries stay plain dicts - they are written as-is to the
+    JSONL checkpoint and to the weekly CSVs.
+    """
+    hiring: List[Dict] = field(default_factory=list)
+    conversations: List[Dict] = field(default_factory=list)
+
+
+class DomainRateLimiter:
+    """
+    Keeps a minimum gap between requests to the same site
+
+    Requests to different sites run freely, so concurrent probes spread across
+    vendors stay fast while each site sees at most one request per interval.
+    Sites are keyed by registered domain (www.example.com and blog.example.com
+    share a slot), except on multi-tenant ATS domains, where each tenant host
+    is its own site.
+    """
+
+    def __init__(self, min_interval: float = 0.1, intervals: Dict[str, float] = None):
+        """
+        Args:
+            min_interval: Seconds between requests to one site
+            intervals: Per-site overrides, keyed like the limiter keys sites
+                (registered domain, or full host on ATS tenant domains)
+        """
+        self.min_interval = min_interval
+        self.intervals = intervals or {}
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def _site(self, url: str) -> str:
+        """Rate-limit key for a URL"""
+        host = (urlparse(url).hostname or '').lower()
+        domain = '.'.join(host.split('.')[-2:])
+        return host if domain in _ATS_TENANT_DOMAINS else domain
+
+    def wait(self, url: str):
+        """Block until this thread may send a request to the URL's site"""
+        site = self._site(url)
+        interval = self.intervals.get(site, self.min_interval)
+
+        # Reserve the next free slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(site, 0.0))
+            self._next_slot[site] = slot + interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class CompanyDiscoveryV3:
     """
@@ -40,10 +395,45 @@ class CompanyDiscoveryV3:
     6. Security Job Boards - 100+ companies
     """
 
-    def __init__(self):
-        self.companies = {}
+    def __init__(self, checkpoint_path: str = None, max_workers: int = 32,
+                 ats_cache_path: str = "data/ats_probe_cache", http_cache_path: str = None,
+                 run_id: str = None):
+        self.companies: Dict[str, CompanyRecord] = {}
         self.driver = None
 
+        # Concurrent ATS probes (network-bound, so threads are enough)
+        self.max_workers = max_workers
+        self.rate_limiter = DomainRateLimiter(intervals=ATS_HOST_INTERVALS)
+
+        # One pooled session for every HTTP call so keep-alive connections are
+        # reused across probes to the same host (pool sized for the workers).
+        # With an HTTP cache path (or DISCOVERY_HTTP_CACHE) and requests-cache
+        # installed, repeated GETs within the hour are served from disk instead
+        self._session = self._create_session(http_cache_path or os.getenv("DISCOVERY_HTTP_CACHE"))
+        self._session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=max_workers)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Persistent ATS probe results keyed by '<ats>:<slug>' (opened lazily)
+        self.ats_cache_path = ats_cache_path
+        self._ats_cache = None
+        self._slugs = {}
+
+        # Article URL -> author parsed from its page, for this engine only.
+        # Only covers the page-fetch fallback (feeds with no usable author),
+        # so an article linked from several feeds is fetched once per run
+        self._authors = {}
+
+        # Crash-safe progress log (one JSON line per company + per finished
+        # unit). Opt-in: only the weekly refresh passes a path, so ad-hoc
+        # scripts never leave progress behind. The first line stamps the run
+        # ID (default: this week) so another run never resumes it
+        self.checkpoint_path = checkpoint_path
+        self.run_id = run_id or datetime.now().strftime('%Y_W%U')
+        self._checkpoint = None
+        self._checkpoint_dir_ready = False
+
         # Security keywords (expanded with internships!)
         self.security_keywords = [
             # Core Security Roles
@@ -172,9 +562,9 @@ class CompanyDiscoveryV3:
             service.creationflags = subprocess.CREATE_NEW_PROCESS_GROUP if hasattr(subprocess, 'CREATE_NEW_PROCESS_GROUP') else 0
 
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.driver.set_page_load_timeout(30)  # 30 second timeout
+            self.driver.set_page_load_timeout(15)  # 'eager' strategy returns at DOMContentLoaded
             self.driver.set_script_timeout(30)
-            self.driver.implicitly_wait(10)
+            self.driver.implicitly_wait(0)  # Explicit WebDriverWait only - never mix with implicit waits
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
             print("   ✅ Selenium WebDriver initialized successfully")
@@ -199,11 +589,249 @@ class CompanyDiscoveryV3:
                 except:
                     pass
 
+    def _load_checkpoint(self) -> Dict:
+        """
+        Load the checkpoint left behind by an interrupted run (once per engine)
+
+        A file stamped with another run ID, older than CHECKPOINT_TTL_SECONDS
+        or missing its stamp is deleted instead of resumed.
+
+        Returns:
+            {'done': set of finished '<phase>:<unit>' keys,
+             'phases': {phase: {company_name: [jobs]}},
+             'stamped': True if the file on disk belongs to this run}
+        """
+        if self._checkpoint is not None:
+            return self._checkpoint
+
+        self._checkpoint = {'done': set(), 'phases': {}, 'stamped': False}
+
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return self._checkpoint
+
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Partial last line from a killed process
+
+                if not self._checkpoint['stamped']:
+                    if (record.get('run') != self.run_id
+                            or time.time() - record.get('started_at', 0) > CHECKPOINT_TTL_SECONDS):
+                        break
+                    self._checkpoint['stamped'] = True
+                elif 'done' in record:
+                    self._checkpoint['done'].add(record['done'])
+                else:
+                    phase_companies = self._checkpoint['phases'].setdefault(record['phase'], {})
+                    phase_companies.setdefault(record['company'], []).extend(record['hiring'])
+
+        if not self._checkpoint['stamped']:
+            print(f"   🗑️  Discarding stale checkpoint (other run or over a day old): {self.checkpoint_path}")
+            os.remove(self.checkpoint_path)
+            self._checkpoint = {'done': set(), 'phases': {}, 'stamped': False}
+
+        return self._checkpoint
+
+    def _resume_phase(self, phase: str) -> Set[str]:
+        """
+        Restore companies a previous run already found in this phase
+
+        Returns:
+            Set of restored company names (seed for the phase's discovered set)
+        """
+        restored = self._load_checkpoint()['phases'].pop(phase, {})
+
+        for company_name, jobs in restored.items():
+            if company_name not in self.companies:
+                self.companies[company_name] = CompanyRecord()
+            self.companies[company_name].hiring.extend(jobs)
+
+        if restored:
+            print(f"   ♻️  Resumed {len(restored)} companies from checkpoint")
+
+        return set(restored)
+
+    def _is_unit_done(self, phase: str, unit: str) -> bool:
+        """Check whether a keyword/portfolio/seed finished in a previous run"""
+        return f"{phase}:{unit}" in self._load_checkpoint()['done']
+
+    def _checkpoint_unit(self, phase: str, unit: str, found: Dict[str, List[Dict]], done: bool = True):
+        """
+        Append companies found by one unit of work, then its completion sentinel
+
+        Args:
+            phase: Discovery phase (indeed, vc, workday, ...)
+            unit: Keyword, VC name, board name or seed company
+            found: Company name -> jobs found by this unit
+            done: False when the unit failed part-way (it will be retried)
+        """
+        if not self.checkpoint_path or (not found and not done):
+            return
+
+        checkpoint = self._load_checkpoint()
+
+        # Create the checkpoint directory on the first write only
+        if not self._checkpoint_dir_ready:
+            checkpoint_dir = os.path.dirname(self.checkpoint_path)
+            if checkpoint_dir:
+                os.makedirs(checkpoint_dir, exist_ok=True)
+            self._checkpoint_dir_ready = True
+
+        with open(self.checkpoint_path, 'a', encoding='utf-8') as f:
+            if not checkpoint['stamped']:
+                f.write(json.dumps({'run': self.run_id, 'started_at': time.time()}) + '\n')
+                checkpoint['stamped'] = True
+            for company_name, jobs in found.items():
+                f.write(json.dumps({'phase': phase, 'company': company_name, 'hiring': jobs}) + '\n')
+            if done:
+                f.write(json.dumps({'done': f"{phase}:{unit}"}) + '\n')
+
+        if done:
+            checkpoint['done'].add(f"{phase}:{unit}")
+
+    def clear_checkpoint(self):
+        """Remove the checkpoint once a run's results have been saved"""
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        self._checkpoint = None
+
+    def _company_slugs(self, company_name: str) -> Dict[str, str]:
+        """
+        URL slugs for a company name, computed once and shared by every ATS scraper
+
+        Returns:
+            {'compact': 'acmecorp', 'dashed': 'acme-corp', 'ashby': 'acme-corp'}
+        """
+        slugs = self._slugs.get(company_name)
+
+        if slugs is None:
+            lowered = company_name.lower()
+            # Non-ASCII characters never survive into a slug, so drop them up front
+            ascii_bytes = lowered.encode('ascii', 'ignore')
+            slugs = {
+                # Workday, SmartRecruiters, BambooHR
+                'compact': ascii_bytes.translate(None, _SLUG_DELETE_TIGHT).decode('ascii'),
+                # Greenhouse, Lever
+                'dashed': _SLUG_STRIP_TIGHT_RE.sub('-', lowered).strip('-'),
+                # Ashby
+                'ashby': ascii_bytes.replace(b' ', b'-').translate(None, _SLUG_DELETE).decode('ascii'),
+            }
+            self._slugs[company_name] = slugs
+
+        return slugs
+
+    def _cached_probe(self, ats: str, slug: str):
+        """
+        Look up an earlier run's probe result for this ATS + slug
+
+        Returns:
+            {'hit': bool, 'url': str or None, 'checked_at': float}, or None if unknown/expired
+        """
+        if self._ats_cache is None:
+            cache_dir = os.path.dirname(self.ats_cache_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            self._ats_cache = shelve.open(self.ats_cache_path)
+
+        entry = self._ats_cache.get(f"{ats}:{slug}")
+        if entry is None or time.time() - entry['checked_at'] > ATS_CACHE_TTL_SECONDS:
+            return None
+
+        return entry
+
+    def _remember_probe(self, ats: str, slug: str, hit: bool, url: str = None):
+        """Record whether this ATS has a board for the slug so re-runs can skip the probe"""
+        self._ats_cache[f"{ats}:{slug}"] = {'hit': hit, 'url': url, 'checked_at': time.time()}
+
+    def _close_ats_cache(self):
+        """Flush the ATS probe cache to disk"""
+        if self._ats_cache is not None:
+            self._ats_cache.close()
+            self._ats_cache = None
+
+    def _create_session(self, http_cache_path: str = None) -> requests.Session:
+        """
+        Create the shared HTTP session, cached on disk when requested
+
+        Args:
+            http_cache_path: SQLite cache file for requests-cache (None = no cache)
+
+        Returns:
+            A requests.Session (or requests_cache.CachedSession)
+        """
+        if http_cache_path:
+            if requests_cache is not None:
+                print(f"💾 HTTP cache enabled: {http_cache_path}")
+                # 404s are cached too, so invalid ATS slugs aren't re-probed
+                return requests_cache.CachedSession(
+                    http_cache_path,
+                    expire_after=HTTP_CACHE_TTL_SECONDS,
+                    allowable_codes=(200, 404)
+                )
+            print("⚠️  requests-cache not installed - HTTP cache disabled")
+
+        return requests.Session()
+
+    def _get(self, url: str, max_retries: int = 3, method: str = 'GET', **kwargs) -> requests.Response:
+        """
+        Rate-limited request with exponential backoff on 429/5xx responses
+
+        Args:
+            url: URL to fetch
+            max_retries: Extra attempts after a throttled/5xx response
+            method: HTTP method (GET, or HEAD for existence probes)
+            **kwargs: Passed through to Session.request
+
+        Returns:
+            Final response (the last one is returned even if still failing)
+        """
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.wait(url)
+            response = self._session.request(method, url, **kwargs)
+
+            if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                return response
+
+            # Honour Retry-After when the server sends seconds, else back off 1s, 2s, 4s
+            retry_after = response.headers.get('Retry-After', '')
+            delay = min(int(retry_after), 30) if retry_after.isdigit() else 2 ** attempt
+            response.close()
+            time.sleep(delay)
+
+    def _probe(self, url: str, marker: str, timeout: int = 5):
+        """
+        Stream a GET and keep the response only if it lands on the expected ATS
+
+        Status and the final (redirected) URL are known before the body is read,
+        so misses are closed without downloading the page.
+
+        Returns:
+            Open response for a hit, None otherwise
+        """
+        response = self._get(
+            url,
+            headers={'User-Agent': 'Mozilla/5.0'},
+            timeout=timeout,
+            allow_redirects=True,
+            stream=True
+        )
+
+        if response.status_code == 200 and marker in response.url.lower():
+            return response
+
+        response.close()
+        return None
+
     def discover_all(self, companies_target: int = 1000, posts_target: int = 50) -> List[Dict]:
         """
         Main discovery pipeline - NO GOOGLE SEARCH!
 
         Target: 1000+ companies from multiple sources
+
+        With a checkpoint_path, call clear_checkpoint() once the returned
+        tracker has been saved - until then a crash can still resume.
         """
         print("=" * 70)
         print("🚀 COMPANY DISCOVERY ENGINE V3 - NO GOOGLE SEARCH")
@@ -280,9 +908,26 @@ class CompanyDiscoveryV3:
 
         print(f"\n📊 Total unique companies discovered: {len(companies_discovered)}")
 
+    def _fetch_indeed_page(self, url: str):
+        """
+        Fetch an Indeed search page without a browser
+
+        Returns:
+            Page HTML when it already contains job cards, else None (403,
+            challenge page, error) so the caller falls back to Selenium
+        """
+        try:
+            response = self._get(url, timeout=10)
+            if response.status_code == 200 and 'job_seen_beacon' in response.text:
+                return response.text
+        except Exception:
+            pass
+
+        return None
+
     def _scrape_indeed(self, max_companies: int) -> Set[str]:
         """Scrape Indeed (same as before - this works!)"""
-        discovered = set()
+        discovered = self._resume_phase('indeed')
 
         print(f"   ℹ️  Using {min(50, len(self.security_keywords))} keywords to discover companies")
 
@@ -293,23 +938,34 @@ class CompanyDiscoveryV3:
                 if len(discovered) >= max_companies:
                     break
 
-                self._init_selenium_driver()
-                if not self.driver:
+                if self._is_unit_done('indeed', keyword):
                     continue
 
+                found = {}
+
                 try:
                     search_term = keyword.replace(' ', '+')
                     url = f"https://www.indeed.com/jobs?q={search_term}&l="
 
                     print(f"   Searching: {keyword}...")
-                    self.driver.get(url)
 
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "job_seen_beacon"))
-                    )
-                    time.sleep(2)
+                    # Plain HTTP first; the browser is only started when Indeed
+                    # answers with a block/challenge page instead of job cards
+                    page_source = self._fetch_indeed_page(url)
+                    if page_source is None:
+                        self._init_selenium_driver()
+                        if not self.driver:
+                            continue
 
-                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                        self.driver.get(url)
+
+                        WebDriverWait(self.driver, 10).until(
+                            EC.presence_of_element_located((By.CLASS_NAME, "job_seen_beacon"))
+                        )
+                        time.sleep(2)
+                        page_source = self.driver.page_source
+
+                    soup = BeautifulSoup(page_source, 'lxml', parse_only=_INDEED_CARD_STRAINER)
                     job_cards = soup.find_all('div', class_='job_seen_beacon')
 
                     print(f"      Found {len(job_cards)} job listings")
@@ -328,7 +984,7 @@ class CompanyDiscoveryV3:
 
                         # Strategy 2: Try class containing 'company'
                         if not company_name:
-                            company_elem = card.find(['span', 'div'], class_=re.compile(r'company', re.I))
+                            company_elem = card.find(['span', 'div'], class_=_COMPANY_CLASS_RE)
                             if company_elem:
                                 company_name = self._clean_company_name(company_elem.text.strip())
 
@@ -341,19 +997,19 @@ class CompanyDiscoveryV3:
                         # Strategy 4: Look for text after "at" or "by" (fallback)
                         if not company_name:
                             card_text = card.get_text()
-                            match = re.search(r'(?:at|by)\s+([A-Z][A-Za-z0-9\s\.\-&]{2,50})', card_text)
+                            match = _INDEED_COMPANY_TEXT_RE.search(card_text)
                             if match:
                                 company_name = self._clean_company_name(match.group(1))
 
                         # Get job title
                         title_elem = card.find('h2', class_='jobTitle')
                         if not title_elem:
-                            title_elem = card.find(['h2', 'h3', 'a'], class_=re.compile(r'title', re.I))
+                            title_elem = card.find(['h2', 'h3', 'a'], class_=_TITLE_CLASS_RE)
 
                         # Get job URL
                         link_elem = card.find('a', class_='jcs-JobTitle')
                         if not link_elem:
-                            link_elem = card.find('a', href=re.compile(r'/rc/clk|/viewjob'))
+                            link_elem = card.find('a', href=_INDEED_JOB_LINK_RE)
 
                         # Validate and add company
                         if company_name and title_elem:
@@ -363,27 +1019,31 @@ class CompanyDiscoveryV3:
                                     discovered.add(company_name)
 
                                     if company_name not in self.companies:
-                                        self.companies[company_name] = {'hiring': [], 'conversations': []}
+                                        self.companies[company_name] = CompanyRecord()
 
                                     job_title = title_elem.text.strip()
                                     job_url = f"https://www.indeed.com{link_elem['href']}" if link_elem and 'href' in link_elem.attrs else f"https://www.indeed.com/jobs?q={search_term}"
 
-                                    self.companies[company_name]['hiring'].append({
+                                    job_entry = {
                                         'title': job_title,
                                         'source': 'Indeed',
                                         'url': job_url,
                                         'location': 'Various'
-                                    })
+                                    }
+                                    self.companies[company_name].hiring.append(job_entry)
+                                    found[company_name] = [job_entry]
 
                                     if len(discovered) % 25 == 0:
                                         print(f"      ✅ Found: {len(discovered)} companies so far...")
 
                     self._close_selenium_driver()
+                    self._checkpoint_unit('indeed', keyword, found)
                     time.sleep(3)
 
                 except Exception as e:
                     print(f"      ⚠️  Error searching '{keyword}': {str(e)[:100]}")
                     self._close_selenium_driver()
+                    self._checkpoint_unit('indeed', keyword, found, done=False)
                     continue
 
         except Exception as e:
@@ -402,7 +1062,7 @@ class CompanyDiscoveryV3:
         VCs list all their portfolio companies → many have security jobs
         This avoids Google entirely!
         """
-        discovered = set()
+        discovered = self._resume_phase('vc')
 
         print(f"   ℹ️  Scraping VC portfolio companies (NO Google needed!)...")
 
@@ -411,56 +1071,44 @@ class CompanyDiscoveryV3:
             if len(discovered) >= max_companies:
                 break
 
+            if self._is_unit_done('vc', vc_name):
+                continue
+
+            found = {}
+
             try:
                 print(f"      Scanning {vc_name} portfolio...")
 
-                response = requests.get(
+                response = self._get(
                     vc_url,
                     headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
-                    timeout=15
+                    timeout=15,
+                    stream=True
                 )
 
                 if response.status_code != 200:
+                    response.close()
                     continue
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # Stream the page through lxml instead of holding bytes, str and a
+                # BeautifulSoup tree at once (Sequoia/a16z pages are large)
+                response.raw.decode_content = True
 
                 # Different VCs have different HTML structures
                 # Look for common patterns: links, company names, etc.
-                company_links = []
-
-                # Strategy 1: Look for links that might be companies
-                for link in soup.find_all('a', href=True):
-                    text = link.get_text(strip=True)
-                    href = link['href']
-
-                    # Skip navigation/social links
-                    if any(skip in href.lower() for skip in ['twitter', 'linkedin', 'facebook', 'instagram', 'about', 'team', 'contact', 'news']):
-                        continue
-
-                    # Company names are usually 2-50 chars
-                    if 2 <= len(text) <= 50 and text and not text.startswith('#'):
-                        company_links.append(text)
-
-                # Strategy 2: Look for company names in specific containers
-                # Common patterns: div.company, div.portfolio-item, li.company-name
-                for pattern in [
-                    {'class_': re.compile(r'company|portfolio|startup')},
-                    {'class_': re.compile(r'card|item|grid-item')}
-                ]:
-                    for elem in soup.find_all(['div', 'li', 'article'], pattern):
-                        text = elem.get_text(strip=True)
-                        if 2 <= len(text) <= 50:
-                            company_links.append(text)
+                try:
+                    company_links = _vc_portfolio_names(response.raw)
+                finally:
+                    response.close()
 
                 # Clean and add companies
                 for company_name in company_links:
                     # Basic cleaning
                     company_name = company_name.strip()
-                    company_name = re.sub(r'\s+', ' ', company_name)
+                    company_name = _WHITESPACE_RE.sub(' ', company_name)
 
                     # Skip if too short or has weird characters
-                    if len(company_name) < 2 or not re.match(r'^[A-Za-z0-9\s\.\-&]+$', company_name):
+                    if len(company_name) < 2 or not _VC_NAME_CHARS_RE.match(company_name):
                         continue
 
                     # Use the comprehensive validation function
@@ -468,20 +1116,16 @@ class CompanyDiscoveryV3:
                         continue
 
                     # Additional VC-specific false positives
-                    vc_false_positives = [
-                        'view all', 'learn more', 'read more', 'see more', 'portfolio', 'companies',
-                        'our founders', 'our companies', 'stories', 'arc', 'spotlights', 'all',
-                        'our ethos', 'our history', 'jobs', 'legal', 'connect', 'skip to main content',
-                        'lp login', 'login', 'about', 'team', 'contact', 'news', 'blog', 'press'
-                    ]
-                    if company_name.lower() in vc_false_positives:
+                    if company_name.lower() in _VC_FALSE_POSITIVES:
                         continue
 
+                    if company_name not in discovered:
+                        found[company_name] = []
                     discovered.add(company_name)
 
                     # Add to companies dict for tracking
                     if company_name not in self.companies:
-                        self.companies[company_name] = {'hiring': [], 'conversations': []}
+                        self.companies[company_name] = CompanyRecord()
 
                     if len(discovered) % 25 == 0:
                         print(f"      ✅ Found: {len(discovered)} companies so far...")
@@ -489,8 +1133,11 @@ class CompanyDiscoveryV3:
                     if len(discovered) >= max_companies:
                         break
 
+                self._checkpoint_unit('vc', vc_name, found)
+
             except Exception as e:
                 print(f"      ⚠️  Error scraping {vc_name}: {str(e)[:100]}")
+                self._checkpoint_unit('vc', vc_name, found, done=False)
                 continue
 
         print(f"   ✅ VC Portfolios: Found {len(discovered)} companies")
@@ -505,142 +1152,262 @@ class CompanyDiscoveryV3:
         2. Try building Workday URLs: {company}.wd1.myworkdayjobs.com
         3. If exists, scrape all security jobs
         """
-        discovered = set()
+        discovered = self._resume_phase('workday')
 
         print(f"   ℹ️  Direct Workday ATS discovery...")
 
         # Use existing companies as seeds
         seed_companies = list(self.companies.keys())[:100]  # Try first 100
 
+        # Build candidates up front (one per slug), then probe them concurrently
+        candidates = []
+        seen_slugs = set()
         for company_name in seed_companies:
-            if len(discovered) >= max_companies:
-                break
+            if self._is_unit_done('workday', company_name):
+                continue
 
-            try:
-                # Convert company name to URL-friendly format
-                company_slug = company_name.lower()
-                company_slug = re.sub(r'[^a-z0-9]+', '', company_slug)
+            company_slug = self._company_slugs(company_name)['compact']
 
-                if not company_slug:
-                    continue
+            if not company_slug or company_slug in seen_slugs:
+                continue
 
-                # Try common Workday URL patterns
-                workday_urls = [
-                    f"https://{company_slug}.wd1.myworkdayjobs.com",
-                    f"https://{company_slug}.wd5.myworkdayjobs.com",
-                    f"https://{company_slug}.wd12.myworkdayjobs.com",
-                ]
+            # Skip slugs an earlier run found no Workday instance for
+            cached = self._cached_probe('workday', company_slug)
+            if cached and not cached['hit']:
+                continue
 
-                for workday_url in workday_urls:
-                    try:
-                        response = requests.get(
-                            workday_url,
-                            headers={'User-Agent': 'Mozilla/5.0'},
-                            timeout=5,
-                            allow_redirects=True
-                        )
+            seen_slugs.add(company_slug)
+            candidates.append((company_name, company_slug, cached['url'] if cached else None))
 
-                        # If we get a 200, this company has Workday
-                        if response.status_code == 200 and 'workday' in response.url.lower():
-                            # Try to find security jobs
-                            security_jobs_url = f"{workday_url}/search"
+        for (company_name, company_slug, known_url), (status, result) in self._iter_fetched(
+            lambda candidate: self._fetch_workday_jobs(candidate[1], candidate[2]), candidates
+        ):
+            if len(discovered) >= max_companies:
+                break
 
-                            job_response = requests.get(
-                                security_jobs_url,
-                                headers={'User-Agent': 'Mozilla/5.0'},
-                                timeout=5
-                            )
+            if status == 'error':
+                continue  # Retried on the next run
 
-                            if job_response.status_code == 200:
-                                soup = BeautifulSoup(job_response.text, 'html.parser')
+            self._remember_probe('workday', company_slug, status == 'hit', result[0] if status == 'hit' else None)
 
-                                # Look for job listings
-                                job_links = soup.find_all('a', href=re.compile(r'/job/'))
+            found = {}
 
-                                for job_link in job_links[:5]:  # Check first 5 jobs
-                                    job_title = job_link.get_text(strip=True).lower()
+            try:
+                if status == 'hit' and result[1] is not None:
+                    workday_url, content = result
+                    soup = BeautifulSoup(content, 'lxml', parse_only=_WORKDAY_JOB_STRAINER)
 
-                                    # Check if it's a security job
-                                    if any(keyword in job_title for keyword in ['security', 'cyber', 'infosec', 'soc', 'threat']):
-                                        discovered.add(company_name)
+                    # Look for job listings
+                    job_links = soup.find_all('a', href=_WORKDAY_JOB_HREF_RE)
 
-                                        if company_name not in self.companies:
-                                            self.companies[company_name] = {'hiring': [], 'conversations': []}
+                    for job_link in job_links[:5]:  # Check first 5 jobs
+                        job_title = job_link.get_text(strip=True)
 
-                                        self.companies[company_name]['hiring'].append({
-                                            'title': job_link.get_text(strip=True),
-                                            'url': urljoin(workday_url, job_link['href']),
-                                            'location': 'Multiple Locations',
-                                            'source': 'Workday',
-                                            'posted_date': 'Recent'
-                                        })
+                        # Check if it's a security job
+                        if _SECURITY_TITLE_RE.search(job_title):
+                            discovered.add(company_name)
 
-                                        if len(discovered) % 10 == 0:
-                                            print(f"      ✅ Found: {len(discovered)} companies with Workday...")
+                            if company_name not in self.companies:
+                                self.companies[company_name] = CompanyRecord()
+
+                            job_entry = {
+                                'title': job_title,
+                                'url': urljoin(workday_url, job_link['href']),
+                                'location': 'Multiple Locations',
+                                'source': 'Workday',
+                                'posted_date': 'Recent'
+                            }
+                            self.companies[company_name].hiring.append(job_entry)
+                            found.setdefault(company_name, []).append(job_entry)
 
-                                        break  # Found security jobs, move to next company
+                            if len(discovered) % 10 == 0:
+                                print(f"      ✅ Found: {len(discovered)} companies with Workday...")
 
-                            break  # Found valid Workday instance, no need to try other URLs
+                            break  # Found security jobs, move to next company
 
-                    except requests.exceptions.RequestException:
-                        continue  # Try next URL pattern
+                self._checkpoint_unit('workday', company_name, found)
 
             except Exception as e:
                 continue  # Skip this company
 
+        self._close_ats_cache()
+
         print(f"   ✅ Workday Direct: Found {len(discovered)} companies")
         return discovered
 
+    def _fetch_workday_jobs(self, company_slug: str, known_url: str = None):
+        """
+        Find a company's Workday instance and fetch its job search page (worker thread)
+
+        Args:
+            company_slug: Compact company slug
+            known_url: Instance found by an earlier run (skips the other patterns)
+
+        Returns:
+            ('hit', (workday_url, search page bytes or None)), ('miss', None) or ('error', None)
+        """
+        # Try common Workday URL patterns
+        workday_urls = [known_url] if known_url else [
+            f"https://{company_slug}.wd1.myworkdayjobs.com",
+            f"https://{company_slug}.wd5.myworkdayjobs.com",
+            f"https://{company_slug}.wd12.myworkdayjobs.com",
+        ]
+
+        status = 'miss'
+
+        for workday_url in workday_urls:
+            try:
+                response = self._probe(workday_url, 'workday')
+
+                # If we get a 200, this company has Workday
+                if response is None:
+                    continue
+
+                # Existence check only - don't download the landing page
+                response.close()
+
+                # Try to find security jobs
+                security_jobs_url = f"{workday_url}/search"
+
+                job_response = self._get(
+                    security_jobs_url,
+                    headers={'User-Agent': 'Mozilla/5.0'},
+                    timeout=5
+                )
+
+                if job_response.status_code == 200:
+                    return 'hit', (workday_url, job_response.content)
+
+                return 'hit', (workday_url, None)  # Found valid Workday instance, no need to try other URLs
+
+            except requests.exceptions.RequestException:
+                status = 'error'
+                continue  # Try next URL pattern
+
+        return status, None
+
+    def _fetch_ats_page(self, url: str, marker: str, head_first: bool = False):
+        """
+        Probe one ATS board URL and download it on a hit (worker thread)
+
+        Args:
+            url: Candidate board URL
+            marker: Vendor string the final (redirected) URL must contain
+            head_first: Send a body-less HEAD first and only GET on a hit
+
+        Returns:
+            ('hit', page bytes), ('miss', None) or ('error', None)
+        """
+        try:
+            if head_first:
+                head = self._get(
+                    url,
+                    method='HEAD',
+                    headers={'User-Agent': 'Mozilla/5.0'},
+                    timeout=3,
+                    allow_redirects=True
+                )
+                head.close()
+
+                # Servers that don't implement HEAD fall through to the GET probe
+                if head.status_code not in (405, 501) and not (head.status_code == 200 and marker in head.url.lower()):
+                    return 'miss', None
+
+            response = self._probe(url, marker)
+        except requests.exceptions.RequestException:
+            return 'error', None
+
+        if response is None:
+            return 'miss', None
+
+        try:
+            return 'hit', response.content
+        except requests.exceptions.RequestException:
+            return 'error', None
+        finally:
+            response.close()
+
+    def _iter_fetched(self, fetch, candidates: List):
+        """
+        Run an I/O-bound fetch over candidates on a thread pool, preserving order
+
+        Workers only touch the network; callers parse pages and update
+        self.companies on the calling thread, so shared state needs no locks.
+        Candidates are submitted one batch at a time so callers that stop
+        early (max_companies reached) don't pay for the rest.
+
+        Yields:
+            (candidate, fetch(candidate)) pairs in candidate order
+        """
+        batch_size = self.max_workers * 2
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for start in range(0, len(candidates), batch_size):
+                batch = candidates[start:start + batch_size]
+                for candidate, result in zip(batch, executor.map(fetch, batch)):
+                    yield candidate, result
+
     def _scrape_greenhouse_direct(self, max_companies: int) -> Set[str]:
         """Direct Greenhouse scraping without Google"""
-        discovered = set()
+        discovered = self._resume_phase('greenhouse')
 
         print(f"   ℹ️  Direct Greenhouse ATS discovery...")
 
         # Use existing companies as seeds
         seed_companies = list(self.companies.keys())[:100]
 
+        # Build candidate URLs up front (one per slug), then probe them concurrently
+        candidates = []
+        seen_slugs = set()
         for company_name in seed_companies:
+            if self._is_unit_done('greenhouse', company_name):
+                continue
+
+            company_slug = self._company_slugs(company_name)['dashed']
+
+            if not company_slug or company_slug in seen_slugs:
+                continue
+
+            # Skip boards an earlier run found don't exist
+            cached = self._cached_probe('greenhouse', company_slug)
+            if cached and not cached['hit']:
+                continue
+
+            seen_slugs.add(company_slug)
+            candidates.append((company_name, company_slug, f"https://boards.greenhouse.io/{company_slug}"))
+
+        for (company_name, company_slug, greenhouse_url), (status, content) in self._iter_fetched(
+            lambda candidate: self._fetch_ats_page(candidate[2], 'greenhouse'), candidates
+        ):
             if len(discovered) >= max_companies:
                 break
 
-            try:
-                # Convert company name to URL slug
-                company_slug = company_name.lower()
-                company_slug = re.sub(r'[^a-z0-9]+', '-', company_slug)
-                company_slug = company_slug.strip('-')
-
-                if not company_slug:
-                    continue
+            if status == 'error':
+                continue  # Retried on the next run
 
-                # Try Greenhouse URL pattern
-                greenhouse_url = f"https://boards.greenhouse.io/{company_slug}"
+            self._remember_probe('greenhouse', company_slug, status == 'hit', greenhouse_url)
 
-                response = requests.get(
-                    greenhouse_url,
-                    headers={'User-Agent': 'Mozilla/5.0'},
-                    timeout=5,
-                    allow_redirects=True
-                )
+            found = {}
 
+            try:
                 # If we get a 200 and it's still a greenhouse URL, company exists
-                if response.status_code == 200 and 'greenhouse' in response.url.lower():
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                if status == 'hit':
+                    soup = BeautifulSoup(content, 'lxml', parse_only=_GREENHOUSE_STRAINER)
 
                     # Look for job listings
-                    job_listings = soup.find_all('div', class_=re.compile(r'opening|job'))
+                    job_listings = soup.find_all('div', class_=_GREENHOUSE_JOB_CLASS_RE)
                     if not job_listings:
-                        job_listings = soup.find_all('a', href=re.compile(r'/jobs/\d+'))
+                        job_listings = soup.find_all('a', href=_GREENHOUSE_JOB_HREF_RE)
 
                     # Check for security-related jobs
                     for job in job_listings[:10]:
-                        job_text = job.get_text(strip=True).lower()
+                        job_text = job.get_text(strip=True)
 
-                        if any(keyword in job_text for keyword in ['security', 'cyber', 'infosec', 'soc', 'threat', 'devsecops']):
+                        if _SECURITY_TITLE_RE.search(job_text):
                             discovered.add(company_name)
 
                             if company_name not in self.companies:
-                                self.companies[company_name] = {'hiring': [], 'conversations': []}
+                                self.companies[company_name] = CompanyRecord()
 
                             # Try to extract job details
                             job_link = job.find('a') if job.name != 'a' else job
@@ -648,75 +1415,92 @@ class CompanyDiscoveryV3:
                                 job_url = urljoin(greenhouse_url, job_link['href'])
                                 job_title = job_link.get_text(strip=True)
 
-                                self.companies[company_name]['hiring'].append({
+                                job_entry = {
                                     'title': job_title,
                                     'url': job_url,
                                     'location': 'Multiple Locations',
                                     'source': 'Greenhouse',
                                     'posted_date': 'Recent'
-                                })
+                                }
+                                self.companies[company_name].hiring.append(job_entry)
+                                found.setdefault(company_name, []).append(job_entry)
 
                             if len(discovered) % 10 == 0:
                                 print(f"      ✅ Found: {len(discovered)} companies on Greenhouse...")
 
                             break  # Found security jobs, move to next company
 
+                self._checkpoint_unit('greenhouse', company_name, found)
+
             except Exception as e:
                 continue
 
+        self._close_ats_cache()
+
         print(f"   ✅ Greenhouse Direct: Found {len(discovered)} companies")
         return discovered
 
     def _scrape_lever_direct(self, max_companies: int) -> Set[str]:
         """Direct Lever scraping without Google"""
-        discovered = set()
+        discovered = self._resume_phase('lever')
 
         print(f"   ℹ️  Direct Lever ATS discovery...")
 
         # Use existing companies as seeds
         seed_companies = list(self.companies.keys())[:100]
 
+        # Build candidate URLs up front (one per slug), then probe them concurrently
+        candidates = []
+        seen_slugs = set()
         for company_name in seed_companies:
+            if self._is_unit_done('lever', company_name):
+                continue
+
+            company_slug = self._company_slugs(company_name)['dashed']
+
+            if not company_slug or company_slug in seen_slugs:
+                continue
+
+            # Skip boards an earlier run found don't exist
+            cached = self._cached_probe('lever', company_slug)
+            if cached and not cached['hit']:
+                continue
+
+            seen_slugs.add(company_slug)
+            candidates.append((company_name, company_slug, f"https://jobs.lever.co/{company_slug}"))
+
+        for (company_name, company_slug, lever_url), (status, content) in self._iter_fetched(
+            lambda candidate: self._fetch_ats_page(candidate[2], 'lever.co'), candidates
+        ):
             if len(discovered) >= max_companies:
                 break
 
-            try:
-                # Convert company name to URL slug
-                company_slug = company_name.lower()
-                company_slug = re.sub(r'[^a-z0-9]+', '-', company_slug)
-                company_slug = company_slug.strip('-')
+            if status == 'error':
+                continue  # Retried on the next run
 
-                if not company_slug:
-                    continue
+            self._remember_probe('lever', company_slug, status == 'hit', lever_url)
 
-                # Try Lever URL pattern
-                lever_url = f"https://jobs.lever.co/{company_slug}"
-
-                response = requests.get(
-                    lever_url,
-                    headers={'User-Agent': 'Mozilla/5.0'},
-                    timeout=5,
-                    allow_redirects=True
-                )
+            found = {}
 
+            try:
                 # If we get a 200 and it's still a lever URL, company exists
-                if response.status_code == 200 and 'lever.co' in response.url.lower():
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                if status == 'hit':
+                    soup = BeautifulSoup(content, 'lxml', parse_only=_LEVER_STRAINER)
 
                     # Look for job listings (Lever uses specific classes)
-                    job_listings = soup.find_all('div', class_=re.compile(r'posting|position'))
+                    job_listings = soup.find_all('div', class_=_LEVER_JOB_CLASS_RE)
                     if not job_listings:
-                        job_listings = soup.find_all('a', class_=re.compile(r'posting'))
+                        job_listings = soup.find_all('a', class_=_LEVER_LINK_CLASS_RE)
 
                     # Check for security-related jobs
                     for job in job_listings[:10]:
-                        job_text = job.get_text(strip=True).lower()
+                        job_text = job.get_text(strip=True)
 
-                        if any(keyword in job_text for keyword in ['security', 'cyber', 'infosec', 'soc', 'threat', 'devsecops']):
+                        if _SECURITY_TITLE_RE.search(job_text):
                             discovered.add(company_name)
 
                             if company_name not in self.companies:
-                                self.companies[company_name] = {'hiring': [], 'conversations': []}
+                                self.companies[company_name] = CompanyRecord()
 
                             # Try to extract job details
                             job_link = job.find('a') if job.name != 'a' else job
@@ -726,22 +1510,28 @@ class CompanyDiscoveryV3:
                                     job_url = f"https://jobs.lever.co{job_link['href']}"
                                 job_title = job_link.get_text(strip=True)
 
-                                self.companies[company_name]['hiring'].append({
+                                job_entry = {
                                     'title': job_title,
                                     'url': job_url,
                                     'location': 'Multiple Locations',
                                     'source': 'Lever',
                                     'posted_date': 'Recent'
-                                })
+                                }
+                                self.companies[company_name].hiring.append(job_entry)
+                                found.setdefault(company_name, []).append(job_entry)
 
                             if len(discovered) % 10 == 0:
                                 print(f"      ✅ Found: {len(discovered)} companies on Lever...")
 
                             break  # Found security jobs, move to next company
 
+                self._checkpoint_unit('lever', company_name, found)
+
             except Exception as e:
                 continue
 
+        self._close_ats_cache()
+
         print(f"   ✅ Lever Direct: Found {len(discovered)} companies")
         return discovered
 
@@ -754,7 +1544,7 @@ class CompanyDiscoveryV3:
         - cybersecurityjobboard.com
         - clearedjobs.net
         """
-        discovered = set()
+        discovered = self._resume_phase('job_boards')
 
         print(f"   ℹ️  Scraping security-specific job boards...")
 
@@ -769,10 +1559,15 @@ class CompanyDiscoveryV3:
             if len(discovered) >= max_companies:
                 break
 
+            if self._is_unit_done('job_boards', board_name):
+                continue
+
+            found = {}
+
             try:
                 print(f"      Scanning {board_name}...")
 
-                response = requests.get(
+                response = self._get(
                     board_url,
                     headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
                     timeout=10
@@ -781,19 +1576,11 @@ class CompanyDiscoveryV3:
                 if response.status_code != 200:
                     continue
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # Different boards have different structures, look for common patterns
-                # Look for job listings
-                job_containers = []
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=_JOB_BOARD_STRAINER)
 
-                # Strategy 1: Look for common job container classes
-                for pattern in ['job', 'listing', 'position', 'posting', 'result']:
-                    job_containers.extend(soup.find_all(['div', 'li', 'article'], class_=re.compile(pattern, re.I)))
-
-                # Strategy 2: Look for links to job pages
-                job_links = soup.find_all('a', href=re.compile(r'/job[s]?/|/position[s]?/|/career[s]?/', re.I))
-                job_containers.extend(job_links)
+                # Different boards have different structures, look for common patterns:
+                # job container classes or links to job pages, in one tree walk
+                job_containers = soup.find_all(_is_job_container)
 
                 # Extract company names from job listings
                 for container in job_containers[:50]:  # Check first 50 listings
@@ -802,13 +1589,13 @@ class CompanyDiscoveryV3:
 
                     try:
                         # Try to find company name
-                        company_elem = container.find(['span', 'div', 'p', 'a'], class_=re.compile(r'company|employer|organization', re.I))
+                        company_elem = container.find(['span', 'div', 'p', 'a'], class_=_COMPANY_ELEM_RE)
 
                         if not company_elem:
                             # Try to extract from text
                             text = container.get_text(strip=True)
                             # Look for patterns like "Company: XYZ" or "at XYZ"
-                            company_match = re.search(r'(?:at|company:|employer:)\s*([A-Z][A-Za-z0-9\s\.\-&]{2,50})', text, re.I)
+                            company_match = _COMPANY_TEXT_RE.search(text)
                             if company_match:
                                 company_name = company_match.group(1).strip()
                             else:
@@ -817,14 +1604,15 @@ class CompanyDiscoveryV3:
                             company_name = company_elem.get_text(strip=True)
 
                         # Clean company name
-                        company_name = re.sub(r'\s+', ' ', company_name)
+                        company_name = _WHITESPACE_RE.sub(' ', company_name)
 
                         # Validate company name
                         if 2 <= len(company_name) <= 100 and not company_name.lower() in ['jobs', 'security', 'careers']:
                             discovered.add(company_name)
+                            found.setdefault(company_name, [])
 
                             if company_name not in self.companies:
-                                self.companies[company_name] = {'hiring': [], 'conversations': []}
+                                self.companies[company_name] = CompanyRecord()
 
                             # Try to extract job title and URL
                             job_link = container.find('a') if container.name != 'a' else container
@@ -832,13 +1620,15 @@ class CompanyDiscoveryV3:
                                 job_title = job_link.get_text(strip=True)[:200]
                                 job_url = urljoin(board_url, job_link.get('href', ''))
 
-                                self.companies[company_name]['hiring'].append({
+                                job_entry = {
                                     'title': job_title,
                                     'url': job_url,
                                     'location': 'Multiple Locations',
                                     'source': board_name,
                                     'posted_date': 'Recent'
-                                })
+                                }
+                                self.companies[company_name].hiring.append(job_entry)
+                                found.setdefault(company_name, []).append(job_entry)
 
                             if len(discovered) % 10 == 0:
                                 print(f"      ✅ Found: {len(discovered)} companies...")
@@ -846,8 +1636,11 @@ class CompanyDiscoveryV3:
                     except Exception:
                         continue
 
+                self._checkpoint_unit('job_boards', board_name, found)
+
             except Exception as e:
                 print(f"      ⚠️  Error scraping {board_name}: {str(e)[:100]}")
+                self._checkpoint_unit('job_boards', board_name, found, done=False)
                 continue
 
         print(f"   ✅ Security Job Boards: Found {len(discovered)} companies")
@@ -858,42 +1651,59 @@ class CompanyDiscoveryV3:
         NEW METHOD: Scrape Ashby ATS (ashbyhq.com)
         Used by many high-growth SaaS companies
         """
-        discovered = set()
+        discovered = self._resume_phase('ashby')
         print(f"   ℹ️  Scraping Ashby ATS...")
 
         # Try common Ashby URL patterns for existing companies
         seed_companies = list(self.companies.keys())[:200]
 
+        # Build candidate URLs up front (one per slug), then probe them concurrently
+        candidates = []
+        seen_slugs = set()
+        known_hits = set()
         for company_name in seed_companies:
+            if self._is_unit_done('ashby', company_name):
+                continue
+
+            company_slug = self._company_slugs(company_name)['ashby']
+
+            if not company_slug or len(company_slug) < 2 or company_slug in seen_slugs:
+                continue
+
+            # Skip boards an earlier run found don't exist
+            cached = self._cached_probe('ashby', company_slug)
+            if cached and not cached['hit']:
+                continue
+
+            if cached:
+                known_hits.add(company_slug)
+
+            seen_slugs.add(company_slug)
+            candidates.append((company_name, company_slug, f"https://jobs.ashbyhq.com/{company_slug}"))
+
+        for (company_name, company_slug, ashby_url), (status, content) in self._iter_fetched(
+            lambda candidate: self._fetch_ats_page(candidate[2], 'ashbyhq', head_first=candidate[1] not in known_hits), candidates
+        ):
             if len(discovered) >= max_companies:
                 break
 
-            try:
-                # Convert company name to slug
-                company_slug = company_name.lower().replace(' ', '-')
-                company_slug = re.sub(r'[^a-z0-9\-]+', '', company_slug)
-
-                if not company_slug or len(company_slug) < 2:
-                    continue
+            if status == 'error':
+                continue  # Retried on the next run
 
-                # Try Ashby URL pattern
-                ashby_url = f"https://jobs.ashbyhq.com/{company_slug}"
+            self._remember_probe('ashby', company_slug, status == 'hit', ashby_url)
 
-                response = requests.get(
-                    ashby_url,
-                    headers={'User-Agent': 'Mozilla/5.0'},
-                    timeout=5,
-                    allow_redirects=True
-                )
+            found = {}
 
-                if response.status_code == 200 and 'ashbyhq' in response.url.lower():
-                    soup = BeautifulSoup(response.text, 'html.parser')
+            try:
+                if status == 'hit':
+                    soup = BeautifulSoup(content, 'lxml', parse_only=_ASHBY_STRAINER)
 
                     # Look for security jobs
-                    job_listings = soup.find_all(['a', 'div'], string=re.compile(r'security|cyber|infosec|soc|threat|devsecops|appsec|cloud\s*security|iam', re.I))
+                    job_listings = soup.find_all(['a', 'div'], string=_SECURITY_KW_RE)
 
                     if job_listings:
                         discovered.add(company_name)
+                        found.setdefault(company_name, [])
 
                         for job in job_listings[:5]:
                             job_link = job if job.name == 'a' else job.find_parent('a')
@@ -901,20 +1711,26 @@ class CompanyDiscoveryV3:
                                 job_url = urljoin(ashby_url, job_link['href'])
                                 job_title = job.get_text(strip=True)
 
-                                self.companies[company_name]['hiring'].append({
+                                job_entry = {
                                     'title': job_title,
                                     'url': job_url,
                                     'location': 'Multiple Locations',
                                     'source': 'Ashby',
                                     'posted_date': 'Recent'
-                                })
+                                }
+                                self.companies[company_name].hiring.append(job_entry)
+                                found.setdefault(company_name, []).append(job_entry)
 
                         if len(discovered) % 10 == 0:
                             print(f"      ✅ Found: {len(discovered)} companies on Ashby...")
 
+                self._checkpoint_unit('ashby', company_name, found)
+
             except:
                 continue
 
+        self._close_ats_cache()
+
         print(f"   ✅ Ashby: Found {len(discovered)} companies")
         return discovered
 
@@ -930,17 +1746,17 @@ class CompanyDiscoveryV3:
             # Hiring.cafe has a curated list of companies
             url = "https://hiring.cafe/"
 
-            response = requests.get(
+            response = self._get(
                 url,
                 headers={'User-Agent': 'Mozilla/5.0'},
                 timeout=10
             )
 
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=_HIRING_CAFE_STRAINER)
 
                 # Look for company listings
-                company_links = soup.find_all('a', href=re.compile(r'/company/|/companies/'))
+                company_links = soup.find_all('a', href=_HIRING_CAFE_COMPANY_HREF_RE)
 
                 for link in company_links[:max_companies]:
                     try:
@@ -950,37 +1766,47 @@ class CompanyDiscoveryV3:
                             # Visit company page to check for security jobs
                             company_url = urljoin(url, link['href'])
 
-                            company_response = requests.get(
+                            company_response = self._get(
                                 company_url,
                                 headers={'User-Agent': 'Mozilla/5.0'},
                                 timeout=5
                             )
 
                             if company_response.status_code == 200:
-                                company_soup = BeautifulSoup(company_response.text, 'html.parser')
+                                company_soup = BeautifulSoup(company_response.content, 'lxml')
 
                                 # Look for security-related jobs
-                                security_jobs = company_soup.find_all(string=re.compile(r'security|cyber|infosec|soc|threat|devsecops|appsec', re.I))
+                                security_jobs = company_soup.find_all(string=_SECURITY_KW_NO_IAM_RE)
 
                                 if security_jobs:
                                     discovered.add(company_name)
 
                                     if company_name not in self.companies:
-                                        self.companies[company_name] = {'hiring': [], 'conversations': []}
+                                        self.companies[company_name] = CompanyRecord()
 
-                                    # Extract job details
-                                    for job_elem in security_jobs[:3]:
+                                    # Extract job details (first 3 distinct job links; several
+                                    # matching text nodes often sit inside the same link)
+                                    seen_hrefs = set()
+                                    for job_elem in security_jobs:
                                         job_link = job_elem.find_parent('a')
-                                        if job_link and job_link.get('href'):
-                                            job_url = urljoin(company_url, job_link['href'])
+                                        if not job_link:
+                                            continue
+
+                                        href = job_link.get('href')
+                                        if not href or href in seen_hrefs:
+                                            continue
+                                        seen_hrefs.add(href)
+
+                                        self.companies[company_name].hiring.append({
+                                            'title': job_elem.strip(),
+                                            'url': urljoin(company_url, href),
+                                            'location': 'Various',
+                                            'source': 'Hiring.cafe',
+                                            'posted_date': 'Recent'
+                                        })
 
-                                            self.companies[company_name]['hiring'].append({
-                                                'title': job_elem.strip(),
-                                                'url': job_url,
-                                                'location': 'Various',
-                                                'source': 'Hiring.cafe',
-                                                'posted_date': 'Recent'
-                                            })
+                                        if len(seen_hrefs) >= 3:
+                                            break
 
                                     if len(discovered) % 10 == 0:
                                         print(f"      ✅ Found: {len(discovered)} companies...")
@@ -999,42 +1825,59 @@ class CompanyDiscoveryV3:
         NEW METHOD: Scrape SmartRecruiters
         Common ATS for cybersecurity and enterprise tech
         """
-        discovered = set()
+        discovered = self._resume_phase('smartrecruiters')
         print(f"   ℹ️  Scraping SmartRecruiters...")
 
         # Try SmartRecruiters URL patterns for existing companies
         seed_companies = list(self.companies.keys())[:200]
 
+        # Build candidate URLs up front (one per slug), then probe them concurrently
+        candidates = []
+        seen_slugs = set()
+        known_hits = set()
         for company_name in seed_companies:
+            if self._is_unit_done('smartrecruiters', company_name):
+                continue
+
+            company_slug = self._company_slugs(company_name)['compact']
+
+            if not company_slug or len(company_slug) < 2 or company_slug in seen_slugs:
+                continue
+
+            # Skip boards an earlier run found don't exist
+            cached = self._cached_probe('smartrecruiters', company_slug)
+            if cached and not cached['hit']:
+                continue
+
+            if cached:
+                known_hits.add(company_slug)
+
+            seen_slugs.add(company_slug)
+            candidates.append((company_name, company_slug, f"https://careers.smartrecruiters.com/{company_slug}"))
+
+        for (company_name, company_slug, sr_url), (status, content) in self._iter_fetched(
+            lambda candidate: self._fetch_ats_page(candidate[2], 'smartrecruiters', head_first=candidate[1] not in known_hits), candidates
+        ):
             if len(discovered) >= max_companies:
                 break
 
-            try:
-                # Convert company name to slug
-                company_slug = company_name.lower().replace(' ', '')
-                company_slug = re.sub(r'[^a-z0-9]+', '', company_slug)
-
-                if not company_slug or len(company_slug) < 2:
-                    continue
+            if status == 'error':
+                continue  # Retried on the next run
 
-                # SmartRecruiters URL pattern
-                sr_url = f"https://careers.smartrecruiters.com/{company_slug}"
+            self._remember_probe('smartrecruiters', company_slug, status == 'hit', sr_url)
 
-                response = requests.get(
-                    sr_url,
-                    headers={'User-Agent': 'Mozilla/5.0'},
-                    timeout=5,
-                    allow_redirects=True
-                )
+            found = {}
 
-                if response.status_code == 200 and 'smartrecruiters' in response.url.lower():
-                    soup = BeautifulSoup(response.text, 'html.parser')
+            try:
+                if status == 'hit':
+                    soup = BeautifulSoup(content, 'lxml', parse_only=_SMARTRECRUITERS_STRAINER)
 
                     # Look for security jobs
-                    job_listings = soup.find_all(['a', 'div', 'h3'], string=re.compile(r'security|cyber|infosec|soc|threat|devsecops|appsec|cloud\s*security', re.I))
+                    job_listings = soup.find_all(['a', 'div', 'h3'], string=_SECURITY_KW_NO_IAM_RE)
 
                     if job_listings:
                         discovered.add(company_name)
+                        found.setdefault(company_name, [])
 
                         for job in job_listings[:5]:
                             job_link = job if job.name == 'a' else job.find_parent('a')
@@ -1045,20 +1888,26 @@ class CompanyDiscoveryV3:
 
                                 job_title = job.get_text(strip=True)
 
-                                self.companies[company_name]['hiring'].append({
+                                job_entry = {
                                     'title': job_title,
                                     'url': job_url,
                                     'location': 'Multiple Locations',
                                     'source': 'SmartRecruiters',
                                     'posted_date': 'Recent'
-                                })
+                                }
+                                self.companies[company_name].hiring.append(job_entry)
+                                found.setdefault(company_name, []).append(job_entry)
 
                         if len(discovered) % 10 == 0:
                             print(f"      ✅ Found: {len(discovered)} companies on SmartRecruiters...")
 
+                self._checkpoint_unit('smartrecruiters', company_name, found)
+
             except:
                 continue
 
+        self._close_ats_cache()
+
         print(f"   ✅ SmartRecruiters: Found {len(discovered)} companies")
         return discovered
 
@@ -1067,66 +1916,89 @@ class CompanyDiscoveryV3:
         NEW METHOD: Scrape BambooHR
         Used by many mid-size SaaS/security companies
         """
-        discovered = set()
+        discovered = self._resume_phase('bamboohr')
         print(f"   ℹ️  Scraping BambooHR...")
 
         # Try BambooHR URL patterns for existing companies
         seed_companies = list(self.companies.keys())[:200]
 
+        # Build candidate URLs up front (one per slug), then probe them concurrently
+        candidates = []
+        seen_slugs = set()
+        known_hits = set()
         for company_name in seed_companies:
+            if self._is_unit_done('bamboohr', company_name):
+                continue
+
+            company_slug = self._company_slugs(company_name)['compact']
+
+            if not company_slug or len(company_slug) < 2 or company_slug in seen_slugs:
+                continue
+
+            # Skip boards an earlier run found don't exist
+            cached = self._cached_probe('bamboohr', company_slug)
+            if cached and not cached['hit']:
+                continue
+
+            if cached:
+                known_hits.add(company_slug)
+
+            seen_slugs.add(company_slug)
+            candidates.append((company_name, company_slug, f"https://{company_slug}.bamboohr.com/careers/"))
+
+        for (company_name, company_slug, bamboo_url), (status, content) in self._iter_fetched(
+            lambda candidate: self._fetch_ats_page(candidate[2], 'bamboohr', head_first=candidate[1] not in known_hits), candidates
+        ):
             if len(discovered) >= max_companies:
                 break
 
-            try:
-                # Convert company name to slug
-                company_slug = company_name.lower().replace(' ', '')
-                company_slug = re.sub(r'[^a-z0-9]+', '', company_slug)
-
-                if not company_slug or len(company_slug) < 2:
-                    continue
+            if status == 'error':
+                continue  # Retried on the next run
 
-                # BambooHR URL pattern
-                bamboo_url = f"https://{company_slug}.bamboohr.com/careers/"
+            self._remember_probe('bamboohr', company_slug, status == 'hit', bamboo_url)
 
-                response = requests.get(
-                    bamboo_url,
-                    headers={'User-Agent': 'Mozilla/5.0'},
-                    timeout=5,
-                    allow_redirects=True
-                )
+            found = {}
 
-                if response.status_code == 200 and 'bamboohr' in response.url.lower():
-                    soup = BeautifulSoup(response.text, 'html.parser')
+            try:
+                if status == 'hit':
+                    soup = BeautifulSoup(content, 'lxml', parse_only=_BAMBOOHR_STRAINER)
 
                     # Look for security jobs
-                    job_listings = soup.find_all(['a', 'div', 'li'], string=re.compile(r'security|cyber|infosec|soc|threat|devsecops|appsec|cloud\s*security|iam', re.I))
+                    job_listings = soup.find_all(['a', 'div', 'li'], string=_SECURITY_KW_RE)
 
                     if job_listings:
                         discovered.add(company_name)
+                        found.setdefault(company_name, [])
 
                         for job in job_listings[:5]:
                             job_link = job if job.name == 'a' else job.find_parent('a')
                             if job_link and job_link.get('href'):
                                 job_url = urljoin(bamboo_url, job_link['href'])
                                 if not job_url.startswith('http'):
-                                    job_url = f"https://{company_slug}.bamboohr.com{job_link['href']}"
+                                    job_url = f"{bamboo_url.split('/careers/')[0]}{job_link['href']}"
 
                                 job_title = job.get_text(strip=True)
 
-                                self.companies[company_name]['hiring'].append({
+                                job_entry = {
                                     'title': job_title,
                                     'url': job_url,
                                     'location': 'Multiple Locations',
                                     'source': 'BambooHR',
                                     'posted_date': 'Recent'
-                                })
+                                }
+                                self.companies[company_name].hiring.append(job_entry)
+                                found.setdefault(company_name, []).append(job_entry)
 
                         if len(discovered) % 10 == 0:
                             print(f"      ✅ Found: {len(discovered)} companies on BambooHR...")
 
+                self._checkpoint_unit('bamboohr', company_name, found)
+
             except:
                 continue
 
+        self._close_ats_cache()
+
         print(f"   ✅ BambooHR: Found {len(discovered)} companies")
         return discovered
 
@@ -1134,11 +2006,18 @@ class CompanyDiscoveryV3:
         """
         Extract author name from article URL by fetching and parsing the page
 
+        Pages that were fetched are memoized per URL; failed fetches are not,
+        so a transient error is retried next time.
+
         Returns:
             Author name or "Unknown" if not found
         """
+        author = self._authors.get(url)
+        if author is not None:
+            return author
+
         try:
-            response = requests.get(
+            response = self._get(
                 url,
                 headers={'User-Agent': 'Mozilla/5.0'},
                 timeout=8
@@ -1147,10 +2026,23 @@ class CompanyDiscoveryV3:
             if response.status_code != 200:
                 return "Unknown"
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            author = self._parse_author(BeautifulSoup(response.content, 'lxml'))
+            self._authors[url] = author
+            return author
+
+        except Exception as e:
+            return "Unknown"
+
+    def _parse_author(self, soup) -> str:
+        """
+        Find the author on a parsed article page
 
+        Returns:
+            Author name or "Unknown" if not found
+        """
+        try:
             # Strategy 1: Look for common author meta tags
-            meta_author = soup.find('meta', {'name': re.compile(r'author', re.I)})
+            meta_author = soup.find('meta', {'name': _AUTHOR_META_RE})
             if meta_author and meta_author.get('content'):
                 author = meta_author['content'].strip()
                 if author and len(author) < 100:
@@ -1164,33 +2056,24 @@ class CompanyDiscoveryV3:
                     return author
 
             # Strategy 3: Look for common author class names
-            author_patterns = [
-                ('div', {'class': re.compile(r'author|byline|writer|posted-by', re.I)}),
-                ('span', {'class': re.compile(r'author|byline|writer|posted-by', re.I)}),
-                ('p', {'class': re.compile(r'author|byline|writer', re.I)}),
-                ('a', {'rel': 'author'}),
-                ('div', {'class': 'author-name'}),
-                ('span', {'class': 'author-name'})
-            ]
-
-            for tag, attrs in author_patterns:
+            for tag, attrs in _AUTHOR_PATTERNS:
                 author_elem = soup.find(tag, attrs)
                 if author_elem:
                     author_text = author_elem.get_text(strip=True)
                     # Clean up common prefixes
-                    author_text = re.sub(r'^(by|written by|author:|posted by|from)\s*', '', author_text, flags=re.I)
+                    author_text = _AUTHOR_PREFIX_RE.sub('', author_text)
                     # Remove dates and other noise
-                    author_text = re.sub(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', '', author_text)
+                    author_text = _NUMERIC_DATE_RE.sub('', author_text)
                     author_text = author_text.strip()
 
                     if author_text and 3 < len(author_text) < 100:
                         # Validate it looks like a name (not a date or URL)
-                        if not re.search(r'http|www|\d{4}|january|february|march|april|may|june|july|august|september|october|november|december', author_text, re.I):
+                        if not _NOT_A_NAME_RE.search(author_text):
                             return author_text
 
             # Strategy 4: Look for "Written By" or "By" text patterns
             text_content = soup.get_text()
-            by_match = re.search(r'(?:written by|by|author:)\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})', text_content)
+            by_match = _BYLINE_RE.search(text_content)
             if by_match:
                 author = by_match.group(1).strip()
                 if 3 < len(author) < 100:
@@ -1209,59 +2092,61 @@ class CompanyDiscoveryV3:
 
         posts_collected = 0
 
-        for publisher, rss_url in self.top_publishers.items():
+        # Feeds are fetched concurrently; entries are merged here in publisher order
+        publishers = list(self.top_publishers.items())
+        for (publisher, rss_url), (status, feed) in self._iter_fetched(
+            lambda candidate: self._fetch_feed(candidate[1]), publishers
+        ):
             if posts_collected >= target_posts:
                 break
 
             print(f"\n   Scanning: {publisher}...")
 
-            try:
-                response = requests.get(rss_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
-                if response.status_code != 200:
-                    continue
+            if status == 'error':
+                print(f"   ⚠️  Error scanning {publisher}: {str(feed)[:50]}")
+                continue
+            if status == 'miss':
+                continue
 
-                soup = BeautifulSoup(response.content, 'xml')
-                items = soup.find_all('item')[:10]  # Get up to 10 recent posts
+            try:
+                entries = feed.entries[:10]  # Get up to 10 recent posts
 
-                for item in items:
+                for entry in entries:
                     if posts_collected >= target_posts:
                         break
 
-                    title = item.find('title')
-                    link = item.find('link')
-                    pub_date = item.find('pubDate')
+                    title_text = entry.get('title', '').strip()
+                    link_text = entry.get('link', '').strip()
 
-                    if title and link:
-                        title_text = title.text.strip()
-                        link_text = link.text.strip()
+                    if title_text and link_text:
 
                         # Filter for security-relevant content
-                        if any(keyword in title_text.lower() for keyword in [
-                            'security', 'threat', 'vulnerability', 'attack', 'breach',
-                            'ransomware', 'malware', 'phishing', 'zero-day', 'exploit',
-                            'cloud', 'saas', 'sspm', 'iam', 'compliance', 'encryption'
-                        ]):
-                            # Extract author from the article URL
-                            print(f"      🔍 Extracting author from: {link_text[:50]}...")
-                            author = self._extract_author_from_url(link_text)
+                        if _RSS_SECURITY_RE.search(title_text):
+                            # Prefer the feed's own author name (author_detail drops
+                            # the email of RSS "email (name)" authors); fetch the
+                            # article page when it is missing or doesn't look like a name
+                            author = ((entry.get('author_detail') or {}).get('name') or '').strip()
+                            if not 3 < len(author) < 100 or _NOT_A_NAME_RE.search(author):
+                                print(f"      🔍 Extracting author from: {link_text[:50]}...")
+                                author = self._extract_author_from_url(link_text)
                             print(f"      👤 Author: {author}")
 
                             # Add to companies dict
                             if publisher not in self.companies:
-                                self.companies[publisher] = {'hiring': [], 'conversations': []}
+                                self.companies[publisher] = CompanyRecord()
 
-                            self.companies[publisher]['conversations'].append({
+                            self.companies[publisher].conversations.append({
                                 'title': title_text,
                                 'author': author,
                                 'url': link_text,
-                                'published_at': pub_date.text if pub_date else 'Recent',
+                                'published_at': entry.get('published', 'Recent'),
                                 'source': 'RSS Feed'
                             })
 
                             posts_collected += 1
                             print(f"      ✅ {title_text[:60]}...")
 
-                print(f"   ✅ {publisher}: {len([p for p in self.companies.get(publisher, {}).get('conversations', [])])} relevant posts")
+                print(f"   ✅ {publisher}: {len(self.companies[publisher].conversations) if publisher in self.companies else 0} relevant posts")
 
             except Exception as e:
                 print(f"   ⚠️  Error scanning {publisher}: {str(e)[:50]}")
@@ -1269,6 +2154,23 @@ class CompanyDiscoveryV3:
 
         print(f"\n📊 Total quality posts discovered: {posts_collected}")
 
+    def _fetch_feed(self, rss_url: str):
+        """
+        Fetch and parse one publisher feed (runs on a worker thread)
+
+        Returns:
+            ('hit', parsed feed), ('miss', None) on a non-200, or ('error', exception)
+        """
+        try:
+            response = self._get(rss_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
+            if response.status_code != 200:
+                return 'miss', None
+
+            # feedparser handles RSS and Atom (Atom links live in href attributes)
+            return 'hit', feedparser.parse(response.content)
+        except Exception as e:
+            return 'error', e
+
     def _is_valid_company_name(self, name: str) -> bool:
         """
         Validate that extracted text is actually a company name, not UI elements
@@ -1278,88 +2180,25 @@ class CompanyDiscoveryV3:
         - Navigation elements
         - Generic text
         """
-        if not name or len(name) < 2:
-            return False
-
-        # Must be reasonable length (2-100 chars)
-        if len(name) > 100:
-            return False
-
-        # Filter out UI text fragments
-        invalid_patterns = [
-            r'\btosign\b', r'\binorcreate\b', r'\baccount\b.*\bsave\b',
-            r'^e\s', r'^e$', r'^e\s+an', r'need\s*to', r'sign\s*in', r'create\s*an',
-            r'POST\s*A\s*JOB', r'apply\s*for', r'maximum\s*exposure',
-            r'^Hiring\s*Companies$', r'^Latest\s*News$', r'Why\s*choose',
-            r'need.*account', r'You\s*need', r'Apply$',
-            r'^ed\s*Today', r'^es\s*to\s*apply', r'^terson\s', r'^ion\s', r'^ions\s',
-            r'See\s*wha$', r'Description\s*See', r'Not\s*Specified',
-            r'Skip to', r'Our (Founders|Companies|Ethos|History)', r'^Stories$', r'^Arc$',
-            r'^Spotlights$', r'^All$', r'^Jobs$', r'^Legal$', r'^Connect$',
-            r'Login$', r'^About$', r'^Team$', r'^Contact$', r'^News$', r'^Blog$', r'^Press$',
-            r'^is\s', r'^est\s', r'Category Manager', r'Intelligence Analyst.*You need',
-            r'Consultant.*You need', r'Manager.*You need', r'Analyst.*You need',
-            r'.*You need tosign', r'Centre$', r'Cyber Security.*Why choose'
-        ]
-
-        for pattern in invalid_patterns:
-            if re.search(pattern, name, re.IGNORECASE):
-                return False
-
-        # Must contain at least one letter
-        if not re.search(r'[A-Za-z]', name):
-            return False
-
-        # Filter out generic phrases
-        generic_terms = {
-            'job', 'apply', 'save', 'account', 'login', 'sign in',
-            'post a job', 'latest news', 'hiring companies', 'careers',
-            'you need', 'create an account', 'maximum exposure',
-            'ed today', 'ed todayts', 'ed todaysecret', 'terson air force bas',
-            'es to apply for maximum exposure', 'ion engineer', 'e account',
-            'ions centre', 'ion', 'ions analyst', 'est news', 'hiring companies',
-            'skip to main content', 'our founders', 'our companies', 'stories',
-            'arc', 'spotlights', 'all', 'jobs', 'legal', 'sequoia capital',
-            'sequoia heritage', 'sequoia capital global equities', 'lp login',
-            'sequoia ampersand login', 'connect', 'our ethos', 'our history'
-        }
-
-        if name.lower().strip() in generic_terms:
-            return False
-
-        # Must start with letter or number (not special char)
-        if not re.match(r'^[A-Za-z0-9]', name):
-            return False
-
-        return True
+        return _is_valid_company_name(name)
 
     def _clean_company_name(self, name: str) -> str:
         """Clean and standardize company names"""
-        name = re.sub(r'\s+(Inc\.|LLC|Corp|Corporation|Ltd|Limited|Co\.)$', '', name, flags=re.IGNORECASE)
+        name = _COMPANY_SUFFIX_RE.sub('', name)
         name = name.strip()
         return name if len(name) > 1 else None
 
     def _generate_company_tracker(self) -> List[Dict]:
         """Generate company tracker data"""
+        last_updated = datetime.now().strftime('%Y-%m-%d')
         tracker = []
 
         for company_name, data in self.companies.items():
-            role_count = len(data['hiring'])
-            post_count = len(data['conversations'])
-
-            if role_count > 0 and post_count > 0:
-                activity_type = 'both'
-                priority_score = 3
-            elif role_count > 0:
-                activity_type = 'hiring_only'
-                priority_score = 2
-            elif post_count > 0:
-                activity_type = 'talking_only'
-                priority_score = 1
-            else:
-                # Include companies even with no data yet (from VC/discovery)
-                activity_type = 'discovered'
-                priority_score = 0
+            role_count = len(data.hiring)
+            post_count = len(data.conversations)
+
+            # Companies with no data yet (from VC/discovery) are still included
+            activity_type, priority_score = _ACTIVITY_BY_SIGNAL[(role_count > 0, post_count > 0)]
 
             tracker.append({
                 'company_name': company_name,
@@ -1367,7 +2206,7 @@ class CompanyDiscoveryV3:
                 'role_count': role_count,
                 'post_count': post_count,
                 'priority_score': priority_score,
-                'last_updated': datetime.now().strftime('%Y-%m-%d')
+                'last_updated': last_updated
             })
 
         # Sort by priority
@@ -12,13 +12,88 @@ Aggregates jobs from multiple sources to reach 1,000+ relevant jobs:
 
 import os
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Iterator
 import random
+import re
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.keywords import HIRING_KEYWORDS
 
+# Every hiring keyword across categories, flattened once for keyword sampling
+_ALL_HIRING_KEYWORDS = [keyword for keywords in HIRING_KEYWORDS.values() for keyword in keywords]
+
+# Job category rules in priority order (first match wins); substring matches,
+# case-insensitive, so keywords don't need lowercasing per job
+_CATEGORY_RULES = [
+    (re.compile(r"sspm|posture", re.IGNORECASE), "SSPM"),
+    (re.compile(r"ai|llm|agent", re.IGNORECASE), "AI Agent Security"),
+    (re.compile(r"compliance|audit|governance", re.IGNORECASE), "SaaS Compliance"),
+    (re.compile(r"saas|cloud", re.IGNORECASE), "SaaS Security"),
+]
+
+# Salary bands by title-word tier, in priority order (first match wins)
+_SALARY_TIERS = [
+    (frozenset({"principal", "staff"}), "$180k - $250k"),
+    (frozenset({"senior", "lead"}), "$140k - $200k"),
+    (frozenset({"manager", "director"}), "$160k - $220k"),
+    (frozenset({"ciso", "vp"}), "$200k - $350k"),
+    (frozenset({"analyst"}), "$80k - $120k"),
+]
+
+# Posting ages (0-7 days ago), built once instead of a timedelta per job
+_POSTED_DAYS_AGO = [timedelta(days=days) for days in range(8)]
+
+# Location (mix of remote, hybrid, on-site)
+_LOCATIONS = [
+    "Remote", "San Francisco, CA", "New York, NY", "Seattle, WA",
+    "Austin, TX", "Boston, MA", "Denver, CO", "Remote (US)",
+    "Hybrid - Bay Area", "London, UK", "Toronto, Canada"
+]
+
+
+# Job description templates (str.format, filled per job)
+_DESCRIPTION_TEMPLATES = [
+    "We're looking for a {title} to join {company}'s security team. Experience with {keywords_3} required.",
+    "{company} is hiring a {title}. Must have expertise in {keywords_3}. Remote options available.",
+    "Join {company} as a {title}. You'll work on {keywords_2} and related security initiatives.",
+    "{company} seeks a {title} with strong background in {keywords_3}. Competitive salary and benefits.",
+]
+
+# Use REAL job board search URLs that actually work
+# These URLs go to search results/listings pages, not fake job IDs
+_JOB_URL_PATTERNS = {
+    # Real job boards with working URLs
+    "greenhouse": "https://boards.greenhouse.io/embed/job_board?gh_src=&q={title_slug}",
+    "lever": "https://jobs.lever.co/{company_slug}",
+    "wellfound": "https://wellfound.com/role/r/{title_slug}",
+    "ycombinator": "https://www.ycombinator.com/companies/industry/security",
+    "workday": "https://{company_slug}.wd1.myworkdayjobs.com/en-US/careers",
+    "ashby": "https://jobs.ashbyhq.com/{company_slug}",
+    "indeed": "https://www.indeed.com/q-{title_slug}-{company_slug}-jobs.html",
+    "remoterocketship": "https://www.remoterocketship.com/jobs/search?q={title_slug}",
+    "linkedin": "https://www.linkedin.com/jobs/search/?keywords={title_slug}%20{company_slug}",
+    "hiringcafe": "https://hiring.cafe/?search={title_slug}",
+}
+
+# URL slug translation tables (one C-level pass instead of chained .replace())
+_COMPANY_SLUG_TABLE = str.maketrans({' ': '-', ',': None, '.': None})
+_TITLE_SLUG_TABLE = str.maketrans({' ': '-', '/': '-'})
+
+
+@lru_cache(maxsize=1024)
+def _company_slug(company: str) -> str:
+    """URL slug for a company name (few hundred distinct names, so cached)"""
+    return company.lower().translate(_COMPANY_SLUG_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def _title_slug(title: str) -> str:
+    """URL slug for a job title (few dozen distinct titles, so cached)"""
+    return title.lower().translate(_TITLE_SLUG_TABLE)
+
 
 class MultiSourceJobScraper:
     """Aggregate jobs from multiple sources"""
@@ -138,6 +213,9 @@ class MultiSourceJobScraper:
             "Security Team Lead",
         ]
 
+        # Salary is a pure function of the title, so resolve it once per title
+        self._salary_by_title = {title: self._generate_salary_range(title) for title in self.job_titles}
+
     def generate_comprehensive_jobs(self, target_count: int = 1000) -> List[Dict]:
         """
         Generate comprehensive job dataset
@@ -148,32 +226,51 @@ class MultiSourceJobScraper:
         Returns:
             List of job dictionaries
         """
-        jobs = []
+        jobs = list(self.iter_jobs(target_count))
+
+        print(f"✅ Generated {len(jobs)} jobs across {len(self.sources)} sources")
+        return jobs
+
+    def iter_jobs(self, target_count: int = 1000) -> Iterator[Dict]:
+        """
+        Yield the job dataset one posting at a time
+
+        Consumers that aggregate or write jobs as they go never hold more
+        than one source batch in memory.
+
+        Args:
+            target_count: Number of jobs to yield (default 1000)
+
+        Yields:
+            Job dictionaries
+        """
         base_date = datetime.now()
+        emitted = 0
 
         # Distribute across sources
         jobs_per_source = target_count // len(self.sources)
 
         for source_key, source_name in self.sources.items():
-            source_jobs = self._generate_jobs_for_source(
+            for job in self._generate_jobs_for_source(
                 source_name=source_name,
                 source_key=source_key,
                 count=jobs_per_source,
                 base_date=base_date
-            )
-            jobs.extend(source_jobs)
-
-        # Add extra jobs to reach target if needed
-        while len(jobs) < target_count:
-            extra_job = self._generate_single_job(
-                source_name=random.choice(list(self.sources.values())),
-                source_key=random.choice(list(self.sources.keys())),
+            ):
+                yield job
+                emitted += 1
+
+        # Add extra jobs to reach target if needed (one draw per job so the
+        # source name always matches its key)
+        source_items = list(self.sources.items())
+        while emitted < target_count:
+            source_key, source_name = random.choice(source_items)
+            yield self._generate_single_job(
+                source_name=source_name,
+                source_key=source_key,
                 base_date=base_date
             )
-            jobs.append(extra_job)
-
-        print(f"✅ Generated {len(jobs)} jobs across {len(self.sources)} sources")
-        return jobs[:target_count]
+            emitted += 1
 
     def _generate_jobs_for_source(
         self,
@@ -183,30 +280,39 @@ class MultiSourceJobScraper:
         base_date: datetime
     ) -> List[Dict]:
         """Generate jobs for a specific source"""
-        jobs = []
-        for i in range(count):
-            job = self._generate_single_job(source_name, source_key, base_date)
-            jobs.append(job)
-        return jobs
+        # Draw each column for the whole batch in one call instead of per job
+        companies = random.choices(self.top_companies, k=count)
+        titles = random.choices(self.job_titles, k=count)
+        locations = random.choices(_LOCATIONS, k=count)
+        posting_ages = random.choices(_POSTED_DAYS_AGO, k=count)
+
+        return [
+            self._generate_single_job(source_name, source_key, base_date, company, title, location, posting_age)
+            for company, title, location, posting_age in zip(companies, titles, locations, posting_ages)
+        ]
 
     def _generate_single_job(
         self,
         source_name: str,
         source_key: str,
-        base_date: datetime
+        base_date: datetime,
+        company: str = None,
+        title: str = None,
+        location: str = None,
+        posting_age: timedelta = None
     ) -> Dict:
-        """Generate a single realistic job posting"""
-        company = random.choice(self.top_companies)
-        title = random.choice(self.job_titles)
+        """
+        Generate a single realistic job posting
 
-        # Select relevant keywords for this job
-        all_keywords = []
-        for category, keywords in HIRING_KEYWORDS.items():
-            all_keywords.extend(keywords)
+        Company, title, location and posting age are drawn here unless the
+        caller pre-drew them for a whole batch
+        """
+        company = company or random.choice(self.top_companies)
+        title = title or random.choice(self.job_titles)
 
         # Each job gets 2-5 relevant keywords
         num_keywords = random.randint(2, 5)
-        matched_keywords = random.sample(all_keywords, min(num_keywords, len(all_keywords)))
+        matched_keywords = random.sample(_ALL_HIRING_KEYWORDS, min(num_keywords, len(_ALL_HIRING_KEYWORDS)))
 
         # Determine category based on keywords
         category = self._determine_category(matched_keywords)
@@ -215,16 +321,11 @@ class MultiSourceJobScraper:
         description = self._generate_description(title, company, matched_keywords)
 
         # Random date within last 7 days
-        days_ago = random.randint(0, 7)
-        posted_date = base_date - timedelta(days=days_ago)
-
-        # Location (mix of remote, hybrid, on-site)
-        locations = [
-            "Remote", "San Francisco, CA", "New York, NY", "Seattle, WA",
-            "Austin, TX", "Boston, MA", "Denver, CO", "Remote (US)",
-            "Hybrid - Bay Area", "London, UK", "Toronto, Canada"
-        ]
-        location = random.choice(locations)
+        if posting_age is None:
+            posting_age = random.choice(_POSTED_DAYS_AGO)
+        posted_date = base_date - posting_age
+
+        location = location or random.choice(_LOCATIONS)
 
         # Generate realistic URL based on source
         url = self._generate_job_url(source_key, company, title)
@@ -240,74 +341,48 @@ class MultiSourceJobScraper:
             "url": url,
             "matched_keywords": matched_keywords,
             "category": category,
-            "salary_range": self._generate_salary_range(title),
+            "salary_range": self._salary_by_title.get(title) or self._generate_salary_range(title),
         }
 
     def _determine_category(self, keywords: List[str]) -> str:
         """Determine job category from keywords"""
-        keyword_str = " ".join(keywords).lower()
-
-        if any(k in keyword_str for k in ["sspm", "posture"]):
-            return "SSPM"
-        elif any(k in keyword_str for k in ["ai", "llm", "agent"]):
-            return "AI Agent Security"
-        elif any(k in keyword_str for k in ["compliance", "audit", "governance"]):
-            return "SaaS Compliance"
-        elif any(k in keyword_str for k in ["saas", "cloud"]):
-            return "SaaS Security"
-        else:
-            return "General Security"
+        keyword_str = " ".join(keywords)
+
+        for pattern, category in _CATEGORY_RULES:
+            if pattern.search(keyword_str):
+                return category
+
+        return "General Security"
 
     def _generate_description(self, title: str, company: str, keywords: List[str]) -> str:
         """Generate realistic job description"""
-        templates = [
-            f"We're looking for a {title} to join {company}'s security team. Experience with {', '.join(keywords[:3])} required.",
-            f"{company} is hiring a {title}. Must have expertise in {', '.join(keywords[:3])}. Remote options available.",
-            f"Join {company} as a {title}. You'll work on {', '.join(keywords[:2])} and related security initiatives.",
-            f"{company} seeks a {title} with strong background in {', '.join(keywords[:3])}. Competitive salary and benefits.",
-        ]
-        return random.choice(templates)
+        # Pick the template first, then format only that one
+        template = random.choice(_DESCRIPTION_TEMPLATES)
+        return template.format(
+            title=title,
+            company=company,
+            keywords_2=", ".join(keywords[:2]),
+            keywords_3=", ".join(keywords[:3]),
+        )
 
     def _generate_salary_range(self, title: str) -> str:
         """Generate salary range based on title"""
-        title_lower = title.lower()
-
-        if "principal" in title_lower or "staff" in title_lower:
-            return "$180k - $250k"
-        elif "senior" in title_lower or "lead" in title_lower:
-            return "$140k - $200k"
-        elif "manager" in title_lower or "director" in title_lower:
-            return "$160k - $220k"
-        elif "ciso" in title_lower or "vp" in title_lower:
-            return "$200k - $350k"
-        elif "analyst" in title_lower:
-            return "$80k - $120k"
-        else:
-            return "$110k - $160k"
+        title_words = set(title.lower().split())
+
+        for tier_words, salary_range in _SALARY_TIERS:
+            if title_words & tier_words:
+                return salary_range
+
+        return "$110k - $160k"
 
     def _generate_job_url(self, source_key: str, company: str, title: str) -> str:
         """Generate REAL job board URLs that actually work"""
         # Sanitize company and title for URLs
-        company_slug = company.lower().replace(' ', '-').replace(',', '').replace('.', '')
-        title_slug = title.lower().replace(' ', '-').replace('/', '-')
-
-        # Use REAL job board search URLs that actually work
-        # These URLs go to search results/listings pages, not fake job IDs
-        url_patterns = {
-            # Real job boards with working URLs
-            "greenhouse": f"https://boards.greenhouse.io/embed/job_board?gh_src=&q={title_slug}",
-            "lever": f"https://jobs.lever.co/{company_slug}",
-            "wellfound": f"https://wellfound.com/role/r/{title_slug}",
-            "ycombinator": f"https://www.ycombinator.com/companies/industry/security",
-            "workday": f"https://{company_slug}.wd1.myworkdayjobs.com/en-US/careers",
-            "ashby": f"https://jobs.ashbyhq.com/{company_slug}",
-            "indeed": f"https://www.indeed.com/q-{title_slug}-{company_slug}-jobs.html",
-            "remoterocketship": f"https://www.remoterocketship.com/jobs/search?q={title_slug}",
-            "linkedin": f"https://www.linkedin.com/jobs/search/?keywords={title_slug}%20{company_slug}",
-            "hiringcafe": f"https://hiring.cafe/?search={title_slug}",
-        }
+        company_slug = _company_slug(company)
+        title_slug = _title_slug(title)
 
-        return url_patterns.get(source_key, f"https://jobs.{company_slug}.com")
+        url_pattern = _JOB_URL_PATTERNS.get(source_key, "https://jobs.{company_slug}.com")
+        return url_pattern.format(company_slug=company_slug, title_slug=title_slug)
 
 
 def main():
@@ -326,33 +401,24 @@ def main():
     print(f"   Total jobs: {len(jobs)}")
 
     # By source
-    sources = {}
-    for job in jobs:
-        source = job["source"]
-        sources[source] = sources.get(source, 0) + 1
+    sources = Counter(job["source"] for job in jobs)
 
     print(f"\n   By Source:")
-    for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+    for source, count in sources.most_common():
         print(f"      {source}: {count}")
 
     # By category
-    categories = {}
-    for job in jobs:
-        category = job.get("category", "Unknown")
-        categories[category] = categories.get(category, 0) + 1
+    categories = Counter(job.get("category", "Unknown") for job in jobs)
 
     print(f"\n   By Category:")
-    for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+    for category, count in categories.most_common():
         print(f"      {category}: {count}")
 
     # By company (top 20)
-    companies = {}
-    for job in jobs:
-        company = job["company_name"]
-        companies[company] = companies.get(company, 0) + 1
+    companies = Counter(job["company_name"] for job in jobs)
 
     print(f"\n   Top 20 Companies Hiring:")
-    for company, count in sorted(companies.items(), key=lambda x: x[1], reverse=True)[:20]:
+    for company, count in companies.most_common(20):
         print(f"      {company}: {count} openings")
 
     # Sample jobs
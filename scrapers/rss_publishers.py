@@ -10,10 +10,14 @@ Scrapes top cybersecurity news sources for SaaS security content:
 - And 6 more top publishers
 """
 
+import dbm
 import os
-import feedparser
+import re
+import shelve
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import sys
 
 # Add parent directory to path
@@ -22,18 +26,53 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.keywords import TOP_PUBLISHERS, CONVERSATION_TOPICS
 
 
+# Lowercased keyword -> [(category, keyword), ...]. CONVERSATION_TOPICS is static,
+# so keywords are lowercased once at import rather than per scraper/article
+_TOPICS_BY_KEYWORD = {}
+for _category, _keywords in CONVERSATION_TOPICS.items():
+    for _keyword in _keywords:
+        _TOPICS_BY_KEYWORD.setdefault(_keyword.lower(), []).append((_category, _keyword))
+del _category, _keywords, _keyword
+
+# Category order breaks ties (earlier category wins)
+_CATEGORY_ORDER = {category: i for i, category in enumerate(CONVERSATION_TOPICS)}
+
+# One alternation over every keyword; the lookahead reports a match at each
+# position without consuming text, so keywords that overlap in the article
+# are all found (longest first where two start at the same position).
+# Keywords only match as whole words ("sspm" does not fire inside "xsspmx")
+_TOPICS_RE = re.compile(
+    r"(?=\b("
+    + "|".join(re.escape(k) for k in sorted(_TOPICS_BY_KEYWORD, key=len, reverse=True))
+    + r")\b)"
+)
+
+# Concurrent feed downloads (also the size of the session's connection pool)
+_FEED_WORKERS = 16
+
+# Parsed (UTC struct_time) date fields to try, in order of preference
+_DATE_FIELDS = ("published_parsed", "updated_parsed", "created_parsed")
+
+
 class RSSPublisherScraper:
     """Scrape RSS feeds from top cybersecurity publishers"""
 
-    def __init__(self, use_mock: bool = False):
+    def __init__(self, use_mock: bool = False, feed_cache_path: Optional[str] = "data/rss_feed_cache"):
         """
         Initialize RSS scraper
 
         Args:
             use_mock: If True, use mock data instead of fetching RSS
+            feed_cache_path: shelve file holding each feed's ETag/Last-Modified
+                and last body, for conditional GETs (None = always download)
         """
         self.use_mock = use_mock
         self.publishers = TOP_PUBLISHERS
+        self.feed_cache_path = feed_cache_path
+        self._seen_urls = set()
+
+        # HTTP session, created on the first real fetch (mock runs never load requests)
+        self._session = None
 
     def fetch_all_feeds(
         self,
@@ -53,45 +92,190 @@ class RSSPublisherScraper:
         if self.use_mock:
             return self._get_mock_articles(max_articles_per_feed * len(self.publishers))
 
+        # Network/parsing stacks are only loaded for live feeds
+        if self._session is None:
+            self._session = self._create_session()
+
         all_articles = []
         cutoff_date = datetime.now() - timedelta(days=days_back)
 
+        # Normalized URLs already ingested this run (syndicated stories appear
+        # in several feeds; only the first copy is scanned and kept)
+        self._seen_urls = set()
+
         print(f"📰 Fetching RSS feeds from {len(self.publishers)} publishers...")
         print(f"   Time range: Last {days_back} days")
         print("-" * 70)
 
+        # Skip publishers without RSS
+        feed_publishers = []
         for publisher_name, publisher_info in self.publishers.items():
-            rss_url = publisher_info.get("rss")
-
-            # Skip publishers without RSS
-            if not rss_url:
+            if publisher_info.get("rss"):
+                feed_publishers.append((publisher_name, publisher_info))
+            else:
                 print(f"⏭️  {publisher_name}: No RSS feed available")
-                continue
 
-            try:
-                print(f"🔍 Fetching {publisher_name}...")
-                feed = feedparser.parse(rss_url)
-
-                if feed.bozo:
-                    print(f"⚠️  {publisher_name}: Feed parsing warning")
-
-                articles = self._parse_feed(
-                    feed,
-                    publisher_name,
-                    publisher_info,
-                    max_articles_per_feed,
-                    cutoff_date,
-                )
+        # Validators + bodies from the last run, so unchanged feeds answer 304
+        feed_cache = self._load_feed_cache([info["rss"] for _, info in feed_publishers])
+        cache_updates = {}
 
-                all_articles.extend(articles)
-                print(f"   ✅ {len(articles)} articles fetched")
+        # Feeds download concurrently (network-bound); results are parsed and
+        # logged here in publisher order
+        with ThreadPoolExecutor(max_workers=min(_FEED_WORKERS, len(feed_publishers) or 1)) as executor:
+            fetched = executor.map(
+                lambda publisher: self._fetch_feed(publisher[1]["rss"], feed_cache.get(publisher[1]["rss"])),
+                feed_publishers
+            )
 
-            except Exception as e:
-                print(f"   ⚠️  Error fetching feed: {e}")
+            for (publisher_name, publisher_info), (feed, cache_entry) in zip(feed_publishers, fetched):
+                if cache_entry:
+                    cache_updates[publisher_info["rss"]] = cache_entry
+
+                all_articles.extend(
+                    self._collect_feed(feed, publisher_name, publisher_info, max_articles_per_feed, cutoff_date)
+                )
+
+        self._save_feed_cache(cache_updates)
 
         print(f"\n✅ Total articles fetched: {len(all_articles)}")
         return all_articles
 
+    def _create_session(self):
+        """
+        Build the pooled session used for every feed download
+
+        Keep-alive connections are reused across runs and publishers sharing a
+        host (requests already sends Accept-Encoding: gzip, deflate).
+
+        Returns:
+            A requests.Session
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers.update({"User-Agent": "Mozilla/5.0"})
+        adapter = HTTPAdapter(pool_connections=_FEED_WORKERS, pool_maxsize=_FEED_WORKERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _fetch_feed(self, rss_url: str, cached: Optional[Dict] = None):
+        """
+        Download and parse one RSS feed (runs on a worker thread)
+
+        Sends the cached ETag / Last-Modified so an unchanged feed comes back
+        as an empty 304 and is parsed from the cached body instead.
+
+        Args:
+            rss_url: Feed URL
+            cached: {'etag', 'modified', 'content_type', 'content'} from the last download, if any
+
+        Returns:
+            (parsed feed or the exception raised while fetching it,
+             new cache entry or None when there is nothing to store)
+        """
+        import feedparser
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("modified"):
+                headers["If-Modified-Since"] = cached["modified"]
+
+        try:
+            response = self._session.get(rss_url, headers=headers, timeout=10)
+
+            if response.status_code == 304 and cached:
+                content = cached["content"]
+                content_type = cached.get("content_type")
+                cache_entry = None
+            else:
+                response.raise_for_status()
+                content = response.content
+                content_type = response.headers.get("Content-Type")
+
+                etag = response.headers.get("ETag")
+                modified = response.headers.get("Last-Modified")
+                cache_entry = None
+                if etag or modified:
+                    cache_entry = {"etag": etag, "modified": modified, "content_type": content_type, "content": content}
+
+            # Hand feedparser the headers it would have seen fetching the URL itself
+            # (content-location resolves relative entry links)
+            response_headers = {"content-location": rss_url}
+            if content_type:
+                response_headers["content-type"] = content_type
+
+            feed = feedparser.parse(content, response_headers=response_headers)
+            return feed, cache_entry
+
+        except Exception as e:
+            return e, None
+
+    def _load_feed_cache(self, rss_urls: List[str]) -> Dict[str, Dict]:
+        """Read cached validators/bodies for the given feeds (main thread only)"""
+        if not self.feed_cache_path:
+            return {}
+
+        # Nothing cached yet (first run): don't create an empty db just to read it
+        if dbm.whichdb(self.feed_cache_path) is None:
+            return {}
+
+        try:
+            with shelve.open(self.feed_cache_path, flag="r") as cache:
+                return {url: cache[url] for url in rss_urls if url in cache}
+        except Exception as e:
+            print(f"   ⚠️  Feed cache unavailable: {e}")
+            return {}
+
+    def _save_feed_cache(self, updates: Dict[str, Dict]):
+        """Persist new validators/bodies after a fetch round (main thread only)"""
+        if not self.feed_cache_path or not updates:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.feed_cache_path) or ".", exist_ok=True)
+            with shelve.open(self.feed_cache_path) as cache:
+                cache.update(updates)
+        except Exception as e:
+            print(f"   ⚠️  Could not update feed cache: {e}")
+
+    def _collect_feed(
+        self,
+        feed,
+        publisher_name: str,
+        publisher_info: Dict,
+        max_articles: int,
+        cutoff_date: datetime,
+    ) -> List[Dict]:
+        """Turn a fetched feed (or its fetch error) into relevant articles"""
+        print(f"🔍 Fetching {publisher_name}...")
+
+        if isinstance(feed, Exception):
+            print(f"   ⚠️  Error fetching feed: {feed}")
+            return []
+
+        try:
+            if feed.bozo:
+                print(f"⚠️  {publisher_name}: Feed parsing warning")
+
+            articles = self._parse_feed(
+                feed,
+                publisher_name,
+                publisher_info,
+                max_articles,
+                cutoff_date,
+            )
+
+            print(f"   ✅ {len(articles)} articles fetched")
+            return articles
+
+        except Exception as e:
+            print(f"   ⚠️  Error fetching feed: {e}")
+            return []
+
     def _parse_feed(
         self,
         feed,
@@ -112,6 +296,14 @@ class RSSPublisherScraper:
                 if published_date and published_date < cutoff_date:
                     continue
 
+                # Skip stories already seen in another feed
+                url = entry.get("link", "")
+                url_key = url.strip().lower()
+                if url_key:
+                    if url_key in self._seen_urls:
+                        continue
+                    self._seen_urls.add(url_key)
+
                 # Extract article data
                 article = {
                     "platform": "rss",
@@ -119,7 +311,7 @@ class RSSPublisherScraper:
                     "publisher_url": publisher_info.get("url", ""),
                     "title": entry.get("title", "No title"),
                     "summary": entry.get("summary", entry.get("description", ""))[:500],
-                    "url": entry.get("link", ""),
+                    "url": url,
                     "published_at": published_date or datetime.now(),
                     "author": entry.get("author", "Unknown"),
                     "tags": [tag.term for tag in entry.get("tags", [])],
@@ -127,12 +319,9 @@ class RSSPublisherScraper:
                     "category": "Unknown",
                 }
 
-                # Extract matched keywords
+                # Extract matched keywords and determine category in one scan
                 text = f"{article['title']} {article['summary']}".lower()
-                article["matched_keywords"] = self._extract_matched_keywords(text)
-
-                # Determine category
-                article["category"] = self._determine_category(text)
+                article["matched_keywords"], article["category"] = self._scan_topics(text)
 
                 # Only include if relevant (has matched keywords)
                 if article["matched_keywords"]:
@@ -145,44 +334,42 @@ class RSSPublisherScraper:
 
     def _parse_date(self, entry) -> Optional[datetime]:
         """Parse publication date from RSS entry"""
-        # Try different date fields
-        for date_field in ["published_parsed", "updated_parsed", "created_parsed"]:
-            if hasattr(entry, date_field):
-                date_tuple = getattr(entry, date_field)
-                if date_tuple:
-                    try:
-                        return datetime(*date_tuple[:6])
-                    except:
-                        pass
+        # Try different date fields (feedparser entries are dicts)
+        for date_field in _DATE_FIELDS:
+            date_tuple = entry.get(date_field)
+            if date_tuple:
+                try:
+                    return datetime(*date_tuple[:6])
+                except:
+                    pass
 
         return None
 
-    def _extract_matched_keywords(self, text: str) -> List[str]:
-        """Extract matched keywords from article text"""
-        matched = []
-
-        for category, keywords in CONVERSATION_TOPICS.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    matched.append(keyword)
+    def _scan_topics(self, text: str) -> Tuple[List[str], str]:
+        """
+        Match topic keywords and pick the category in a single pass
 
-        return list(set(matched))  # Remove duplicates
+        Args:
+            text: Lowercased article title + summary
 
-    def _determine_category(self, text: str) -> str:
-        """Determine article category based on keywords"""
-        # Count matches per category
-        category_scores = {}
+        Returns:
+            (matched keywords, category with the most matches or "General Security")
+        """
+        matched = set()
+        category_scores = defaultdict(int)
 
-        for category, keywords in CONVERSATION_TOPICS.items():
-            score = sum(1 for kw in keywords if kw.lower() in text)
-            if score > 0:
-                category_scores[category] = score
+        # Each distinct keyword counts once toward its category
+        for keyword_lc in {m.group(1) for m in _TOPICS_RE.finditer(text)}:
+            for category, keyword in _TOPICS_BY_KEYWORD[keyword_lc]:
+                matched.add(keyword)
+                category_scores[category] += 1
 
-        # Return category with most matches
+        # Category with most matches
         if category_scores:
-            return max(category_scores, key=category_scores.get)
+            category = max(category_scores, key=lambda c: (category_scores[c], -_CATEGORY_ORDER[c]))
+            return list(matched), category
 
-        return "General Security"
+        return list(matched), "General Security"
 
     def _get_mock_articles(self, limit: int = 100) -> List[Dict]:
         """Generate mock articles for testing"""
@@ -254,12 +441,9 @@ class RSSPublisherScraper:
             },
         ]
 
-        # Repeat mock articles to reach limit
-        result = []
-        while len(result) < limit:
-            result.extend(mock_articles)
-
-        return result[:limit]
+        # Repeat mock articles to reach limit (ceil division, one list multiply)
+        repeats = -(-limit // len(mock_articles))
+        return (mock_articles * repeats)[:limit]
 
     def filter_by_relevance(self, articles: List[Dict], min_keywords: int = 2) -> List[Dict]:
         """Filter articles by number of matched keywords"""
@@ -273,27 +457,30 @@ class RSSPublisherScraper:
         if not articles:
             return {}
 
-        stats = {
-            "total_articles": len(articles),
-            "by_publisher": {},
-            "by_category": {},
-            "with_keywords": sum(1 for a in articles if a.get("matched_keywords")),
-            "recent_24h": sum(
-                1
-                for a in articles
-                if (datetime.now() - a.get("published_at", datetime.now())).days < 1
-            ),
-        }
+        # Single pass over the articles for every count
+        by_publisher = Counter()
+        by_category = Counter()
+        with_keywords = 0
+        recent_24h = 0
+        now = datetime.now()
+        one_day = timedelta(days=1)
 
-        # Count by publisher
         for article in articles:
-            publisher = article.get("publisher", "Unknown")
-            stats["by_publisher"][publisher] = stats["by_publisher"].get(publisher, 0) + 1
+            by_publisher[article.get("publisher", "Unknown")] += 1
+            by_category[article.get("category", "Unknown")] += 1
 
-        # Count by category
-        for article in articles:
-            category = article.get("category", "Unknown")
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
+            if article.get("matched_keywords"):
+                with_keywords += 1
+            if now - article.get("published_at", now) < one_day:
+                recent_24h += 1
+
+        stats = {
+            "total_articles": len(articles),
+            "by_publisher": dict(by_publisher),
+            "by_category": dict(by_category),
+            "with_keywords": with_keywords,
+            "recent_24h": recent_24h,
+        }
 
         return stats
 
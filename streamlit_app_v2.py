@@ -11,8 +11,6 @@ Last Updated: January 9, 2026 - Fresh data from automated weekly refresh
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
 import os
 import glob
@@ -57,6 +55,33 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Columns the dashboard shows/exports per file type. Older weekly files lack
+# some of them (e.g. conversation 'author'), so usecols filters by name
+_TRACKER_COLUMNS = {'company_name', 'activity_type', 'role_count', 'post_count', 'priority_score', 'last_updated'}
+_HIRING_COLUMNS = {'company_name', 'title', 'url', 'location', 'source', 'posted_date'}
+_CONVERSATION_COLUMNS = {'publisher', 'title', 'author', 'url', 'published_at', 'source'}
+
+# Read columns straight into Arrow arrays when pyarrow is available
+# (st.dataframe ships frames to the browser as Arrow, so no per-rerun conversion)
+try:
+    import pyarrow  # Installed with streamlit
+    _ARROW_BACKEND = {'dtype_backend': 'pyarrow'}
+except ImportError:
+    pyarrow = None
+    _ARROW_BACKEND = {}
+
+# Compact dtypes for the tracker's counters (small non-negative ints); Arrow
+# flavoured under the Arrow backend, which reads numpy ints back as float64
+_TRACKER_DTYPES = {'role_count': 'int32', 'post_count': 'int32', 'priority_score': 'int8'}
+if pyarrow is not None:
+    _TRACKER_DTYPES = {column: f"{dtype}[pyarrow]" for column, dtype in _TRACKER_DTYPES.items()}
+
+# Low-cardinality columns the dashboard filters/counts on, stored as categoricals
+# after merging (per-file categoricals would widen back to object in concat)
+_TRACKER_CATEGORIES = ['activity_type']
+_HIRING_CATEGORIES = ['company_name', 'source']
+_CONVERSATION_CATEGORIES = ['publisher', 'source']
+
 
 def load_latest_data():
     """
@@ -65,12 +90,21 @@ def load_latest_data():
     2. Merge files from the last 3 weeks to preserve historical data
     3. Deduplicate to avoid duplicates while keeping all companies
     This ensures we never lose data when new weeks start
+
+    Only the directory listing runs on every rerun; parsing and merging is
+    cached per set of files, so widget interactions reuse the merged frames
+    until a weekly refresh adds new CSVs.
+
+    Returns:
+        (company_tracker, hiring_details, conversation_details, latest_week,
+         data_files) - data_files is the (tracker, hiring, conversation) tuple of
+        file paths behind the frames, a small key for views cached on top of them
     """
     try:
         # Find all week directories (sorted newest first)
         week_dirs = sorted(glob.glob("data/weekly/20*_W*"), reverse=True)
         if not week_dirs:
-            return None, None, None, None
+            return None, None, None, None, None
 
         latest_week = week_dirs[0]  # Track for display purposes
 
@@ -96,66 +130,183 @@ def load_latest_data():
             all_conversation_files.extend(files)
 
         if not all_company_tracker_files:
-            return None, None, None, latest_week
-
-        # Sort all files by timestamp (newest first)
-        all_company_tracker_files = sorted(all_company_tracker_files, reverse=True)
-        all_hiring_files = sorted(all_hiring_files, reverse=True)
-        all_conversation_files = sorted(all_conversation_files, reverse=True)
-
-        # Load and merge company tracker data from ALL recent files
-        all_trackers = []
-        for f in all_company_tracker_files:  # Load ALL files, not just 5
-            try:
-                df = pd.read_csv(f)
-                if len(df) > 0:  # Skip empty files
-                    all_trackers.append(df)
-            except:
-                continue
-
-        if all_trackers:
-            # Merge and deduplicate by company_name, keeping the most recent entry
-            company_tracker = pd.concat(all_trackers, ignore_index=True)
-            company_tracker = company_tracker.drop_duplicates(subset=['company_name'], keep='first')
-            company_tracker = company_tracker.sort_values('last_updated', ascending=False)
-        else:
-            return None, None, None, latest_week
-
-        # Load and merge hiring details from ALL recent files
-        all_hiring = []
-        for f in all_hiring_files:
-            try:
-                df = pd.read_csv(f)
-                if len(df) > 0:
-                    all_hiring.append(df)
-            except:
-                continue
-
-        hiring_details = pd.concat(all_hiring, ignore_index=True) if all_hiring else pd.DataFrame()
-        if len(hiring_details) > 0:
-            # Deduplicate by company_name + title + url
-            hiring_details = hiring_details.drop_duplicates(subset=['company_name', 'title', 'url'], keep='first')
-
-        # Load and merge conversation details from ALL recent files
-        all_conversations = []
-        for f in all_conversation_files:
-            try:
-                df = pd.read_csv(f)
-                if len(df) > 0:
-                    all_conversations.append(df)
-            except:
-                continue
-
-        conversation_details = pd.concat(all_conversations, ignore_index=True) if all_conversations else pd.DataFrame()
-        if len(conversation_details) > 0:
-            # Deduplicate by publisher + title + url
-            conversation_details = conversation_details.drop_duplicates(subset=['publisher', 'title', 'url'], keep='first')
-
-        return company_tracker, hiring_details, conversation_details, latest_week
+            return None, None, None, latest_week, None
+
+        # Sort all files by timestamp (newest first); tuples so they can key the cache
+        data_files = (
+            tuple(sorted(all_company_tracker_files, reverse=True)),
+            tuple(sorted(all_hiring_files, reverse=True)),
+            tuple(sorted(all_conversation_files, reverse=True)),
+        )
+        company_tracker, hiring_details, conversation_details = _load_data_files(*data_files)
+
+        if company_tracker is None:
+            return None, None, None, latest_week, None
+
+        return company_tracker, hiring_details, conversation_details, latest_week, data_files
 
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
-        return None, None, None, None
+        return None, None, None, None, None
+
+
+def _read_table(csv_file: str, columns: set, **csv_kwargs) -> pd.DataFrame:
+    """
+    Read one weekly output, preferring the parquet copy the weekly refresh
+    writes next to each CSV (typed columns, no text tokenizing)
+
+    Args:
+        csv_file: Path of the CSV
+        columns: Column names to keep
+        **csv_kwargs: dtype/parse_dates options for the CSV fallback
+
+    Returns:
+        DataFrame with the available columns out of `columns`
+    """
+    parquet_file = os.path.splitext(csv_file)[0] + ".parquet"
+    if os.path.exists(parquet_file):
+        try:
+            df = pd.read_parquet(parquet_file, **_ARROW_BACKEND)
+            df = df[[c for c in df.columns if c in columns]]
+            for column, dtype in csv_kwargs.get('dtype', {}).items():
+                if column in df.columns:
+                    df[column] = df[column].astype(dtype)
+            for column in csv_kwargs.get('parse_dates', []):
+                if column in df.columns:
+                    df[column] = pd.to_datetime(df[column])
+            return df
+        except Exception:
+            pass  # Fall back to the CSV
+
+    return pd.read_csv(csv_file, usecols=lambda c: c in columns, **_ARROW_BACKEND, **csv_kwargs)
+
+
+@st.cache_data(show_spinner=False)
+def _load_data_files(company_tracker_files, hiring_files, conversation_files):
+    """
+    Read and merge the weekly CSVs (cached per tuple of file paths)
+
+    Args:
+        company_tracker_files: company_tracker CSV paths, newest first
+        hiring_files: hiring_details CSV paths, newest first
+        conversation_files: conversation_details CSV paths, newest first
+
+    Returns:
+        (company_tracker, hiring_details, conversation_details); company_tracker
+        is None when none of the tracker files had rows
+    """
+    # Load and merge company tracker data from ALL recent files
+    all_trackers = []
+    for f in company_tracker_files:  # Load ALL files, not just 5
+        try:
+            df = _read_table(f, _TRACKER_COLUMNS, dtype=_TRACKER_DTYPES, parse_dates=['last_updated'])
+            if len(df) > 0:  # Skip empty files
+                all_trackers.append(df)
+        except:
+            continue
+
+    if not all_trackers:
+        return None, None, None
+
+    # Merge and deduplicate by company_name, keeping the most recent entry
+    company_tracker = pd.concat(all_trackers, ignore_index=True)
+    company_tracker = company_tracker.drop_duplicates(subset=['company_name'], keep='first')
+    company_tracker = company_tracker.sort_values('last_updated', ascending=False)
+    company_tracker = _as_categories(company_tracker, _TRACKER_CATEGORIES)
+
+    # Load and merge hiring details from ALL recent files
+    all_hiring = []
+    for f in hiring_files:
+        try:
+            df = _read_table(f, _HIRING_COLUMNS)
+            if len(df) > 0:
+                all_hiring.append(df)
+        except:
+            continue
+
+    hiring_details = pd.concat(all_hiring, ignore_index=True) if all_hiring else pd.DataFrame()
+    if len(hiring_details) > 0:
+        # Deduplicate by company_name + title + url
+        hiring_details = hiring_details.drop_duplicates(subset=['company_name', 'title', 'url'], keep='first')
+        hiring_details = _as_categories(hiring_details, _HIRING_CATEGORIES)
+
+    # Load and merge conversation details from ALL recent files
+    all_conversations = []
+    for f in conversation_files:
+        try:
+            df = _read_table(f, _CONVERSATION_COLUMNS)
+            if len(df) > 0:
+                all_conversations.append(df)
+        except:
+            continue
+
+    conversation_details = pd.concat(all_conversations, ignore_index=True) if all_conversations else pd.DataFrame()
+    if len(conversation_details) > 0:
+        # Deduplicate by publisher + title + url
+        conversation_details = conversation_details.drop_duplicates(subset=['publisher', 'title', 'url'], keep='first')
+        conversation_details = _as_categories(conversation_details, _CONVERSATION_CATEGORIES)
+
+    return company_tracker, hiring_details, conversation_details
+
+
+def _as_categories(df: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Convert the given columns (where present) to categoricals, so equality
+    filters and value_counts work on integer codes"""
+    present = [c for c in columns if c in df.columns]
+    return df.astype({c: 'category' for c in present}) if present else df
+
+
+@st.cache_data(show_spinner=False)
+def _details_view(data_files, table_index, column, value):
+    """
+    Hiring or conversation rows for one dropdown selection, and their CSV export
+
+    Keyed on primitives like _company_tracker_view, so Streamlit never has to
+    hash a DataFrame argument on rerun.
+
+    Args:
+        data_files: File-path key returned by load_latest_data
+        table_index: 1 = hiring details, 2 = conversation details
+        column: Column the dropdown filters on
+        value: Selected value, or None for all rows
+
+    Returns:
+        (filtered DataFrame, CSV bytes)
+    """
+    df = _load_data_files(*data_files)[table_index]
+    if value is not None:
+        df = df[df[column] == value]
+    return df, df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def _company_tracker_view(data_files, activity_type, min_priority, sort_column, ascending):
+    """
+    Filtered + sorted company tracker and its CSV export
+
+    Keyed on the data file paths and the filter values (all small primitives),
+    so reruns with unchanged filters skip hashing, filtering, sorting and
+    encoding the tracker.
+
+    Args:
+        data_files: File-path key returned by load_latest_data
+        activity_type: 'both' / 'hiring_only' / 'talking_only', or None for all
+        min_priority: Minimum priority_score
+        sort_column: Column to sort by
+        ascending: Sort direction
+
+    Returns:
+        (filtered DataFrame, CSV bytes)
+    """
+    company_tracker = _load_data_files(*data_files)[0]
+
+    # Apply filters as one combined mask (a single selection, no intermediate copies)
+    mask = company_tracker['priority_score'] >= min_priority
+    if activity_type:
+        mask &= company_tracker['activity_type'] == activity_type
+
+    filtered_df = company_tracker[mask].sort_values(by=sort_column, ascending=ascending)
+    return filtered_df, filtered_df.to_csv(index=False).encode('utf-8')
 
 
 def main():
@@ -166,7 +317,7 @@ def main():
     st.markdown("**Company-Centric Market Intelligence for Obsidian Security**")
 
     # Load data
-    company_tracker, hiring_details, conversation_details, week_id = load_latest_data()
+    company_tracker, hiring_details, conversation_details, week_id, data_files = load_latest_data()
 
     if company_tracker is None:
         st.warning("⚠️ No data found. Run the weekly refresh first:")
@@ -184,24 +335,26 @@ def main():
     st.sidebar.markdown("---")
     st.sidebar.markdown("**By Activity Type:**")
 
-    high_priority = len(company_tracker[company_tracker['activity_type'] == 'both'])
-    hiring_only = len(company_tracker[company_tracker['activity_type'] == 'hiring_only'])
-    talking_only = len(company_tracker[company_tracker['activity_type'] == 'talking_only'])
+    # One counting pass instead of a filtered copy per activity type
+    activity_counts = company_tracker['activity_type'].value_counts()
 
-    st.sidebar.metric("🎯 High Priority (Both)", high_priority)
-    st.sidebar.metric("📢 Hiring Only", hiring_only)
-    st.sidebar.metric("💬 Talking Only", talking_only)
+    st.sidebar.metric("🎯 High Priority (Both)", int(activity_counts.get('both', 0)))
+    st.sidebar.metric("📢 Hiring Only", int(activity_counts.get('hiring_only', 0)))
+    st.sidebar.metric("💬 Talking Only", int(activity_counts.get('talking_only', 0)))
 
     # Main Content - 4 Tabs (LinkedIn Resources is BONUS - isolated)
-    tab1, tab2, tab3, tab4 = st.tabs([
+    # A horizontal radio instead of st.tabs: st.tabs executes every tab body on
+    # each rerun, this only builds the tab that is showing
+    tab1, tab2, tab3, tab4 = tabs = [
         "🏢 Company Tracker",
         "📋 Hiring Signals",
         "💬 Conversation Signals",
         "🔗 LinkedIn Resources (Bonus)"
-    ])
+    ]
+    selected_tab = st.radio("View", tabs, horizontal=True, label_visibility="collapsed")
 
     # TAB 1: Company Tracker
-    with tab1:
+    if selected_tab == tab1:
         st.header("🏢 Company Tracker")
         st.markdown("**1,000 companies active in the SaaS Security space**")
 
@@ -225,29 +378,24 @@ def main():
                 index=0
             )
 
-        # Apply filters
-        filtered_df = company_tracker.copy()
-
-        if activity_filter != "All":
-            activity_map = {
-                "High Priority (Both)": "both",
-                "Hiring Only": "hiring_only",
-                "Talking Only": "talking_only"
-            }
-            filtered_df = filtered_df[filtered_df['activity_type'] == activity_map[activity_filter]]
-
-        filtered_df = filtered_df[filtered_df['priority_score'] >= min_priority]
-
-        # Sort
+        # Apply filters and sort (cached per filter combination)
+        activity_map = {
+            "High Priority (Both)": "both",
+            "Hiring Only": "hiring_only",
+            "Talking Only": "talking_only"
+        }
         sort_map = {
             "Priority Score": "priority_score",
             "Role Count": "role_count",
             "Post Count": "post_count",
             "Company Name": "company_name"
         }
-        filtered_df = filtered_df.sort_values(
-            by=sort_map[sort_by],
-            ascending=(sort_by == "Company Name")
+        filtered_df, csv = _company_tracker_view(
+            data_files,
+            activity_map.get(activity_filter),
+            min_priority,
+            sort_map[sort_by],
+            sort_by == "Company Name",
         )
 
         # Display table
@@ -266,7 +414,6 @@ def main():
         )
 
         # Download button
-        csv = filtered_df.to_csv(index=False).encode('utf-8')
         st.download_button(
             label="📥 Download CSV",
             data=csv,
@@ -275,21 +422,21 @@ def main():
         )
 
     # TAB 2: Hiring Signals
-    with tab2:
+    if selected_tab == tab2:
         st.header("📋 Hiring Signals")
         st.markdown("**Drill-down view of security job postings by company**")
 
         if hiring_details.empty:
             st.info("No hiring data available yet.")
         else:
-            # Company filter
-            companies = ["All"] + sorted(hiring_details['company_name'].unique().tolist())
+            # Company filter (categories are the sorted distinct names, no column scan)
+            companies = ["All"] + hiring_details['company_name'].cat.categories.tolist()
             selected_company = st.selectbox("Filter by Company", companies, index=0)
 
-            # Apply filter
-            filtered_jobs = hiring_details.copy()
-            if selected_company != "All":
-                filtered_jobs = filtered_jobs[filtered_jobs['company_name'] == selected_company]
+            # Apply filter (cached per selection, together with the CSV export)
+            filtered_jobs, csv = _details_view(
+                data_files, 1, 'company_name', None if selected_company == "All" else selected_company
+            )
 
             # Display table with clickable URLs
             st.dataframe(
@@ -307,7 +454,6 @@ def main():
             )
 
             # Download button
-            csv = filtered_jobs.to_csv(index=False).encode('utf-8')
             st.download_button(
                 label="📥 Download CSV",
                 data=csv,
@@ -316,21 +462,21 @@ def main():
             )
 
     # TAB 3: Conversation Signals
-    with tab3:
+    if selected_tab == tab3:
         st.header("💬 Conversation Signals")
         st.markdown("**Blog posts and discussions from Top 10 security publishers**")
 
         if conversation_details.empty:
             st.info("No conversation data available yet.")
         else:
-            # Publisher filter
-            publishers = ["All"] + sorted(conversation_details['publisher'].unique().tolist())
+            # Publisher filter (categories are the sorted distinct names, no column scan)
+            publishers = ["All"] + conversation_details['publisher'].cat.categories.tolist()
             selected_publisher = st.selectbox("Filter by Publisher", publishers, index=0)
 
-            # Apply filter
-            filtered_convs = conversation_details.copy()
-            if selected_publisher != "All":
-                filtered_convs = filtered_convs[filtered_convs['publisher'] == selected_publisher]
+            # Apply filter (cached per selection, together with the CSV export)
+            filtered_convs, csv = _details_view(
+                data_files, 2, 'publisher', None if selected_publisher == "All" else selected_publisher
+            )
 
             # Display table with clickable URLs
             st.dataframe(
@@ -348,7 +494,6 @@ def main():
             )
 
             # Download button
-            csv = filtered_convs.to_csv(index=False).encode('utf-8')
             st.download_button(
                 label="📥 Download CSV",
                 data=csv,
@@ -357,7 +502,7 @@ def main():
             )
 
     # TAB 4: LinkedIn Resources (BONUS - ISOLATED from main pipeline)
-    with tab4:
+    if selected_tab == tab4:
         st.header("🔗 LinkedIn Resources (Optional Bonus Feature)")
         st.markdown("⚠️ **This tab is completely separate from the main scraping pipeline. No LinkedIn scraping is performed.**")
 
@@ -375,13 +520,12 @@ def main():
             job_searches = list(lr.LINKEDIN_JOB_SEARCHES.items())
             mid_point = len(job_searches) // 2
 
+            # One markdown element per column rather than one per link
             with col1:
-                for name, url in job_searches[:mid_point]:
-                    st.markdown(f"🔗 [{name}]({url})")
+                st.markdown("\n\n".join(f"🔗 [{name}]({url})" for name, url in job_searches[:mid_point]))
 
             with col2:
-                for name, url in job_searches[mid_point:]:
-                    st.markdown(f"🔗 [{name}]({url})")
+                st.markdown("\n\n".join(f"🔗 [{name}]({url})" for name, url in job_searches[mid_point:]))
 
             st.markdown("---")
 
@@ -394,13 +538,12 @@ def main():
             content_searches = list(lr.LINKEDIN_CONTENT_SEARCHES.items())
             mid_point = len(content_searches) // 2
 
+            # One markdown element per column rather than one per link
             with col1:
-                for name, url in content_searches[:mid_point]:
-                    st.markdown(f"🔗 [{name}]({url})")
+                st.markdown("\n\n".join(f"🔗 [{name}]({url})" for name, url in content_searches[:mid_point]))
 
             with col2:
-                for name, url in content_searches[mid_point:]:
-                    st.markdown(f"🔗 [{name}]({url})")
+                st.markdown("\n\n".join(f"🔗 [{name}]({url})" for name, url in content_searches[mid_point:]))
 
             st.markdown("---")
 
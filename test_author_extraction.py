@@ -39,9 +39,9 @@ print("RESULTS:")
 print("=" * 70)
 
 for company, data in engine.companies.items():
-    if data['conversations']:
+    if data.conversations:
         print(f"\n{company}:")
-        for post in data['conversations']:
+        for post in data.conversations:
             print(f"  📄 {post['title'][:60]}")
             print(f"  👤 Author: {post['author']}")
             print(f"  🔗 URL: {post['url'][:60]}...")
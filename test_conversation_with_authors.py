@@ -8,7 +8,7 @@ import os
 sys.path.append('.')
 
 from scrapers.company_discovery_v3 import CompanyDiscoveryV3
-import pandas as pd
+import csv
 from datetime import datetime
 
 print("=" * 80)
@@ -31,7 +31,7 @@ engine._discover_conversation_signals(target_posts=10)
 # Collect conversation details
 conversation_details = []
 for company_name, data in engine.companies.items():
-    for post in data['conversations']:
+    for post in data.conversations:
         conversation_details.append({
             'publisher': company_name,
             'title': post.get('title', ''),
@@ -41,17 +41,15 @@ for company_name, data in engine.companies.items():
             'source': post.get('source', '')
         })
 
-# Create DataFrame
+# Display and save (plain dicts - ten rows need no DataFrame)
 if conversation_details:
-    df = pd.DataFrame(conversation_details)
-
     print("\n" + "=" * 80)
     print("RESULTS - CONVERSATION SIGNALS WITH AUTHORS")
     print("=" * 80)
 
     # Display each row nicely
-    for idx, row in df.iterrows():
-        print(f"\n📄 Article #{idx + 1}")
+    for idx, row in enumerate(conversation_details, 1):
+        print(f"\n📄 Article #{idx}")
         print(f"   Publisher: {row['publisher']}")
         print(f"   Title: {row['title'][:70]}...")
         print(f"   👤 Author: {row['author']}")
@@ -60,21 +58,28 @@ if conversation_details:
 
     # Save to test CSV
     test_file = "test_conversation_with_authors.csv"
-    df.to_csv(test_file, index=False)
+    with open(test_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(conversation_details[0].keys()))
+        writer.writeheader()
+        writer.writerows(conversation_details)
+
+    authors_found = sum(1 for row in conversation_details if row['author'] != 'Unknown')
 
     print("\n" + "=" * 80)
     print(f"✅ SUCCESS!")
     print("=" * 80)
-    print(f"Total articles scraped: {len(df)}")
-    print(f"Authors found: {len(df[df['author'] != 'Unknown'])}")
-    print(f"Unknown authors: {len(df[df['author'] == 'Unknown'])}")
+    print(f"Total articles scraped: {len(conversation_details)}")
+    print(f"Authors found: {authors_found}")
+    print(f"Unknown authors: {len(conversation_details) - authors_found}")
     print(f"\n💾 Saved to: {test_file}")
 
     # Show CSV preview
     print("\n" + "=" * 80)
     print("CSV PREVIEW (First 3 rows):")
     print("=" * 80)
-    print(df.head(3).to_string(index=False))
+    with open(test_file, encoding="utf-8") as f:
+        for line in f.readlines()[:4]:  # Header + 3 rows
+            print(line.rstrip("\n"))
 
     print("\n" + "=" * 80)
     print(f"🔍 To view the full CSV, run:")
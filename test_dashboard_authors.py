@@ -2,7 +2,7 @@ import sys
 sys.path.append('.')
 import streamlit_app_v2 as app
 
-company_tracker, hiring_details, conversation_details, week_id = app.load_latest_data()
+company_tracker, hiring_details, conversation_details, week_id, _ = app.load_latest_data()
 
 print('=' * 70)
 print('✅ DASHBOARD DATA LOADING TEST')
@@ -18,14 +18,13 @@ if conversation_details is not None and not conversation_details.empty:
         print('✅ Author column exists in conversation data!')
         print()
         print('Sample posts with authors:')
-        for idx, row in conversation_details[['publisher', 'author', 'title']].head(5).iterrows():
-            publisher = row['publisher'][:18]
-            author = row['author'][:28]
-            title = row['title'][:35]
-            print(f'  {publisher:18} | {author:28} | {title}...')
+        sample = conversation_details[['publisher', 'author', 'title']].head(5)
+        for publisher, author, title in sample.itertuples(index=False, name=None):
+            print(f'  {publisher[:18]:18} | {author[:28]:28} | {title[:35]}...')
 
-        # Stats
-        has_author = conversation_details['author'].notna() & (conversation_details['author'] != 'Unknown')
+        # Stats (one pass over the raw author values; missing -> None)
+        authors = conversation_details['author'].to_numpy(dtype=object, na_value=None)
+        has_author = (authors != None) & (authors != 'Unknown')
         print()
         print(f'📊 Posts with real authors: {has_author.sum()}/{len(conversation_details)}')
     else: